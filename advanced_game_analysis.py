@@ -65,35 +65,109 @@ Database Configuration:
     Note: Add database_config.json to .gitignore to keep credentials secure.
 """
 
+import functools
+import heapq
+import itertools
 import json
+import operator
 import argparse
-from datetime import datetime, timedelta
+import asyncio
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from collections import Counter, defaultdict, namedtuple
+from datetime import datetime, time as dtime
 from chessdotcom import get_player_profile, get_player_games_by_month
 from chessdotcom.client import Client
 import re
 
+import archive_cache
+import analysis_cache
+
 # Try to import required packages, gracefully handle if not available
 try:
-    import pyodbc
-    PYODBC_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    PYODBC_AVAILABLE = False
-    print("⚠️  pyodbc not available. Install with: pip install pyodbc")
-    print("   Database features will be disabled.")
+    AIOHTTP_AVAILABLE = False
 
 try:
-    from azure.identity import ClientSecretCredential
-    import struct
-    AZURE_AUTH_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    AZURE_AUTH_AVAILABLE = False
-    if PYODBC_AVAILABLE:
-        print("⚠️  azure-identity not available. Install with: pip install azure-identity")
-        print("   Azure AD authentication will not be available.")
+    ORJSON_AVAILABLE = False
+
+# pyodbc and azure-identity are imported lazily on first database use
+# (see _load_pyodbc / _load_azure_credential): together they add several
+# hundred ms of import time and pull in cryptography/msal, which the
+# common read-only analysis path never needs.
 
 # IMPORTANT: Set a proper User-Agent header (required by Chess.com API)
 Client.request_config['headers']['User-Agent'] = 'Chess.com Advanced Game Analysis. Contact: your-email@example.com'
 
+# Reuse TCP/TLS connections on the blocking chessdotcom fallback path.
+# Pool size mirrors the aiohttp connector limit so the 12 monthly fetches
+# share handshakes either way. Adapter mounting depends on the installed
+# chessdotcom version exposing its requests.Session, so it is best-effort.
+try:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    if hasattr(Client, 'session'):
+        Client.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=12,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        ))
+except Exception:
+    pass
+
+def _with_retries(request_func, max_tries=5):
+    """
+    Wrap a chessdotcom request function with 429/5xx-aware retries.
+
+    Honors the Retry-After header on rate limits and backs off
+    exponentially on transient server errors instead of letting the
+    caller silently drop a whole month of games.
+
+    Args:
+        request_func: The client request function to wrap
+        max_tries (int): Total attempts before re-raising
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    @functools.wraps(request_func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(max_tries):
+            try:
+                return request_func(*args, **kwargs)
+            except Exception as err:
+                status = getattr(err, 'status_code', None)
+                if attempt == max_tries - 1:
+                    raise
+                if status == 429:
+                    headers = getattr(err, 'headers', None) or {}
+                    try:
+                        wait = float(headers.get('Retry-After', 2))
+                    except (TypeError, ValueError):
+                        wait = 2.0
+                elif status is not None and 500 <= status < 600:
+                    wait = min(60, 2 ** attempt)
+                else:
+                    raise
+                time.sleep(wait)
+    return wrapper
+
+
+# Retry rate-limited and transient failures on every blocking chessdotcom
+# call (profile, stats, monthly archives). The attribute is
+# version-dependent, so the patch is best-effort.
+if hasattr(Client, 'do_get_request'):
+    Client.do_get_request = _with_retries(Client.do_get_request)
+
 # Database configuration file path
 DATABASE_CONFIG_FILE = 'database_config.json'
 
@@ -116,15 +190,17 @@ def load_database_config():
         dict: Database configuration
     """
     try:
-        with open(DATABASE_CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-        return config
+        with open(DATABASE_CONFIG_FILE, 'rb') as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw)
+        return json.loads(raw)
     except FileNotFoundError:
         print(f"⚠️  Database config file '{DATABASE_CONFIG_FILE}' not found.")
         print("   Creating template file...")
         create_database_config_template()
         return DEFAULT_DATABASE_CONFIG.copy()
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"❌ Error parsing '{DATABASE_CONFIG_FILE}'. Using default config.")
         return DEFAULT_DATABASE_CONFIG.copy()
 
@@ -145,31 +221,112 @@ def create_database_config_template():
         print(f"❌ Error creating config file: {e}")
 
 
+# Credential objects and tokens cached per (tenant_id, client_id):
+# tokens are reused until shortly before expiry, so a batch run performs
+# one Azure AD round-trip instead of one per user/connection
+_CREDENTIAL_CACHE = {}
+_TOKEN_CACHE = {}
+
+
+# Fields a usable database config must provide with real values
+_REQUIRED_CONFIG_FIELDS = ('server', 'database', 'tenant_id', 'client_id', 'client_secret')
+
+
+def _missing_config_fields(config):
+    """
+    List required config fields that are absent or still template values.
+
+    Args:
+        config (dict): Configuration from load_database_config()
+
+    Returns:
+        list: Names of missing/incomplete fields, empty when valid
+    """
+    missing = []
+    for field in _REQUIRED_CONFIG_FIELDS:
+        # Fetch once per field instead of config.get + config[field]
+        value = config.get(field)
+        if not value or value.startswith('your-'):
+            missing.append(field)
+    return missing
+
+
+@functools.cache
+def _load_pyodbc():
+    """
+    Import pyodbc on first database use.
+
+    Returns:
+        module: pyodbc, or None if not installed (warns once)
+    """
+    try:
+        import pyodbc
+        # ODBC connection pooling is on by default, but set it
+        # explicitly (must happen before the first connect) so repeated
+        # get_database_connection calls reuse pooled handles
+        pyodbc.pooling = True
+        return pyodbc
+    except ImportError:
+        print("⚠️  pyodbc not available. Install with: pip install pyodbc")
+        print("   Database features will be disabled.")
+        return None
+
+
+@functools.cache
+def _load_azure_credential():
+    """
+    Import azure-identity's ClientSecretCredential on first database use.
+
+    Returns:
+        type: ClientSecretCredential, or None if not installed (warns once)
+    """
+    try:
+        from azure.identity import ClientSecretCredential
+        return ClientSecretCredential
+    except ImportError:
+        print("⚠️  azure-identity not available. Install with: pip install azure-identity")
+        print("   Azure AD authentication will not be available.")
+        return None
+
+
 def get_access_token(tenant_id, client_id, client_secret):
     """
     Get access token for Azure SQL using App Registration credentials.
-    
+
+    Tokens and credential objects are cached at module scope and refreshed
+    only when less than 60 seconds of validity remain.
+
     Args:
         tenant_id (str): Azure AD tenant ID
         client_id (str): App Registration client ID
         client_secret (str): App Registration client secret
-        
+
     Returns:
         str: Access token or None if failed
     """
-    if not AZURE_AUTH_AVAILABLE:
+    ClientSecretCredential = _load_azure_credential()
+    if ClientSecretCredential is None:
         print("❌ Azure authentication not available. Install azure-identity package.")
         return None
-        
+
+    cache_key = (tenant_id, client_id)
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached and cached[1] - time.time() > 60:
+        return cached[0]
+
     try:
-        credential = ClientSecretCredential(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        
+        credential = _CREDENTIAL_CACHE.get(cache_key)
+        if credential is None:
+            credential = ClientSecretCredential(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                client_secret=client_secret
+            )
+            _CREDENTIAL_CACHE[cache_key] = credential
+
         # Get token for Azure SQL Database
         token = credential.get_token("https://database.windows.net/")
+        _TOKEN_CACHE[cache_key] = (token.token, token.expires_on)
         return token.token
     except Exception as e:
         print(f"❌ Error getting access token: {e}")
@@ -198,16 +355,16 @@ def get_database_connection():
     Returns:
         pyodbc.Connection: Database connection object or None if failed
     """
-    if not PYODBC_AVAILABLE:
+    pyodbc = _load_pyodbc()
+    if pyodbc is None:
         return None
-    
+
     # Load database configuration
     config = load_database_config()
-    
+
     # Check if config has required fields
-    required_fields = ['server', 'database', 'tenant_id', 'client_id', 'client_secret']
-    missing_fields = [field for field in required_fields if not config.get(field) or config[field].startswith('your-')]
-    
+    missing_fields = _missing_config_fields(config)
+
     if missing_fields:
         print(f"❌ Missing or incomplete database configuration fields: {', '.join(missing_fields)}")
         print(f"   Please edit {DATABASE_CONFIG_FILE} with your actual values.")
@@ -247,72 +404,202 @@ def get_database_connection():
         return None
 
 
+# Column order for rows inserted into the games table, matching the
+# parameter order the old InsertGame procedure used
+_GAME_COLUMNS = (
+    'username', 'game_id', 'game_date', 'time_control', 'rated', 'rules',
+    'result', 'termination', 'player_color', 'player_rating',
+    'opponent_username', 'opponent_rating', 'opening_moves',
+    'opening_name', 'accuracy_white', 'accuracy_black', 'pgn'
+)
+
+# Analyzed games accumulate in a buffer of at most this many rows before
+# being flushed to the database mid-loop, bounding resident PGN memory
+_DB_FLUSH_ROWS = 10000
+
+# Connection-local staging table for bulk loads: unindexed and
+# unconstrained, so fast_executemany can stream rows at full speed
+# before one set-based MERGE moves them into games
+_STAGING_DDL = """
+CREATE TABLE #games_staging (
+    username NVARCHAR(50),
+    game_id NVARCHAR(100),
+    game_date NVARCHAR(30),
+    time_control NVARCHAR(20),
+    rated INT,
+    rules NVARCHAR(20),
+    result NVARCHAR(10),
+    termination NVARCHAR(50),
+    player_color NVARCHAR(5),
+    player_rating INT,
+    opponent_username NVARCHAR(50),
+    opponent_rating INT,
+    opening_moves NVARCHAR(MAX),
+    opening_name NVARCHAR(100),
+    accuracy_white FLOAT,
+    accuracy_black FLOAT,
+    pgn NVARCHAR(MAX)
+)
+"""
+
+_STAGING_INSERT = (
+    "INSERT INTO #games_staging ({}) VALUES ({})".format(
+        ', '.join(_GAME_COLUMNS), ', '.join('?' * len(_GAME_COLUMNS)))
+)
+
+# Set-based dedup on the server: only game_ids the games table does not
+# already hold for this user are inserted, in one statement
+_MERGE_SQL = """
+MERGE games AS target
+USING #games_staging AS source
+    ON target.username = source.username AND target.game_id = source.game_id
+WHEN NOT MATCHED THEN
+    INSERT ({columns})
+    VALUES ({source_columns});
+""".format(
+    columns=', '.join(_GAME_COLUMNS),
+    source_columns=', '.join(f'source.{column}' for column in _GAME_COLUMNS)
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _insert_sql(n_rows):
+    """
+    Build a multi-row parameterized INSERT for n_rows games.
+
+    Cached per row count: repeated batches of the same shape reuse the
+    string here and hit the same compiled plan on the server, which
+    caches plans by exact SQL text.
+    """
+    row_placeholder = '(' + ', '.join('?' * len(_GAME_COLUMNS)) + ')'
+    return (
+        f"INSERT INTO games ({', '.join(_GAME_COLUMNS)}) VALUES "
+        + ', '.join([row_placeholder] * n_rows)
+    )
+
+
+def _game_row(username, game_analysis):
+    """Flatten an AnalyzedGame into a games-table parameter tuple."""
+    return (
+        username,
+        game_analysis.game_id, game_analysis.date,
+        game_analysis.time_control, 1 if game_analysis.rated else 0,
+        game_analysis.rules, game_analysis.result,
+        game_analysis.termination, game_analysis.player_color,
+        game_analysis.player_rating, game_analysis.opponent_username,
+        game_analysis.opponent_rating, game_analysis.opening_moves,
+        game_analysis.opening_name, game_analysis.accuracy_white,
+        game_analysis.accuracy_black, game_analysis.pgn
+    )
+
+
 def store_game_in_database(connection, username, game_analysis):
     """
     Store game analysis in the database.
-    
+
     Args:
         connection: Database connection
         username (str): Chess.com username
-        game_analysis (dict): Analyzed game data
-        
+        game_analysis (AnalyzedGame): Analyzed game record
+
     Returns:
         bool: True if successful, False otherwise
     """
     if not connection:
         return False
-        
+
     try:
         cursor = connection.cursor()
-        
-        # Prepare data for insertion
-        game_data = {
-            'username': username,
-            'game_id': game_analysis.get('game_id'),
-            'game_date': game_analysis.get('date'),
-            'time_control': game_analysis.get('time_control'),
-            'rated': 1 if game_analysis.get('rated', False) else 0,
-            'rules': game_analysis.get('rules', 'chess'),
-            'result': game_analysis.get('result'),
-            'termination': game_analysis.get('termination'),
-            'player_color': game_analysis.get('player_color'),
-            'player_rating': game_analysis.get('player_rating'),
-            'opponent_username': game_analysis.get('opponent_username'),
-            'opponent_rating': game_analysis.get('opponent_rating'),
-            'opening_moves': game_analysis.get('opening_moves'),
-            'opening_name': game_analysis.get('opening_name'),
-            'accuracy_white': game_analysis.get('accuracy_white'),
-            'accuracy_black': game_analysis.get('accuracy_black'),
-            'pgn': game_analysis.get('pgn')
-        }
-        
-        # Use the stored procedure to insert the game
-        cursor.execute("""
-            EXEC InsertGame 
-                @username = ?, @game_id = ?, @game_date = ?, @time_control = ?,
-                @rated = ?, @rules = ?, @result = ?, @termination = ?,
-                @player_color = ?, @player_rating = ?, @opponent_username = ?,
-                @opponent_rating = ?, @opening_moves = ?, @opening_name = ?,
-                @accuracy_white = ?, @accuracy_black = ?, @pgn = ?
-        """, 
-            game_data['username'], game_data['game_id'], game_data['game_date'],
-            game_data['time_control'], game_data['rated'], game_data['rules'],
-            game_data['result'], game_data['termination'], game_data['player_color'],
-            game_data['player_rating'], game_data['opponent_username'],
-            game_data['opponent_rating'], game_data['opening_moves'],
-            game_data['opening_name'], game_data['accuracy_white'],
-            game_data['accuracy_black'], game_data['pgn']
-        )
-        
+        cursor.execute(_insert_sql(1), _game_row(username, game_analysis))
         connection.commit()
         return True
-        
+
     except Exception as e:
         print(f"❌ Error storing game in database: {e}")
         connection.rollback()
         return False
 
 
+def _existing_game_ids(cursor, username, game_ids):
+    """
+    Fetch the subset of game_ids already stored for a user.
+
+    Args:
+        cursor: Database cursor
+        username (str): Chess.com username
+        game_ids (list): Candidate game IDs
+
+    Returns:
+        set: IDs already present in the games table
+    """
+    existing = set()
+    # One slot goes to username; stay well under the 2100-parameter cap
+    chunk = 2000
+    for start in range(0, len(game_ids), chunk):
+        ids = game_ids[start:start + chunk]
+        cursor.execute(
+            "SELECT game_id FROM games WHERE username = ? AND game_id IN ("
+            + ', '.join('?' * len(ids)) + ")",
+            (username, *ids)
+        )
+        existing.update(row[0] for row in cursor.fetchall())
+    return existing
+
+
+def store_games_batch(connection, username, analyses, batch_size=10000):
+    """
+    Store a batch of analyzed games with a handful of round-trips.
+
+    Rows stream into an unindexed #games_staging temp table via
+    fast_executemany (in batch_size slices; batches over ~100k rows are
+    known to peg CPU on some older unixODBC builds), then one set-based
+    MERGE moves only not-yet-stored game_ids into games. Re-analyzed
+    games therefore dedup on the server in a single statement instead of
+    failing or duplicating row by row.
+
+    Args:
+        connection: Database connection
+        username (str): Chess.com username
+        analyses (list): AnalyzedGame records from analyze_game
+        batch_size (int): Rows per executemany slice
+
+    Returns:
+        int: Number of games stored or already present, or 0 on failure
+    """
+    if not connection or not analyses:
+        return 0
+
+    total = len(analyses)
+
+    try:
+        cursor = connection.cursor()
+
+        # One round-trip prefilter: on re-runs most games are already
+        # stored, so skip shipping their rows (and PGNs) entirely
+        existing = _existing_game_ids(
+            cursor, username, [analysis.game_id for analysis in analyses])
+        if existing:
+            analyses = [a for a in analyses if a.game_id not in existing]
+        if not analyses:
+            return total
+
+        rows = [_game_row(username, analysis) for analysis in analyses]
+
+        cursor.execute(_STAGING_DDL)
+        cursor.fast_executemany = True
+        for start in range(0, len(rows), batch_size):
+            cursor.executemany(_STAGING_INSERT, rows[start:start + batch_size])
+        cursor.execute(_MERGE_SQL)
+        cursor.execute("DROP TABLE #games_staging")
+        connection.commit()
+        return total
+
+    except Exception as e:
+        print(f"❌ Error batch-storing games in database: {e}")
+        connection.rollback()
+        return 0
+
+
 def update_user_statistics_in_database(connection, username):
     """
     Update user statistics in the database using stored procedure.
@@ -382,6 +669,160 @@ def get_user_statistics_from_database(connection, username):
         return None
 
 
+async def _fetch_month(session, username, year, month):
+    """
+    Fetch a single monthly archive with a shared aiohttp session.
+
+    Args:
+        session: Shared aiohttp.ClientSession
+        username (str): Chess.com username
+        year (int): Archive year
+        month (int): Archive month
+
+    Returns:
+        list: Games for that month (empty on any error)
+    """
+    cached = archive_cache.load(username, year, month)
+    if archive_cache.is_immutable(cached, year, month):
+        return cached['games']
+
+    url = f"https://api.chess.com/pub/player/{username}/games/{year}/{month:02d}"
+    headers = archive_cache.conditional_headers(cached)
+    try:
+        for attempt in range(5):
+            async with session.get(url, headers=headers) as response:
+                if response.status == 429:
+                    # Honor Retry-After instead of silently dropping the month
+                    try:
+                        wait = float(response.headers.get('Retry-After', 2))
+                    except (TypeError, ValueError):
+                        wait = 2.0
+                    await asyncio.sleep(min(60.0, wait))
+                    continue
+                if 500 <= response.status < 600:
+                    await asyncio.sleep(min(60, 2 ** attempt))
+                    continue
+                if response.status == 304:
+                    # Archive unchanged since the cached copy
+                    return cached['games']
+                if response.status != 200:
+                    # Genuine miss (e.g. 404: no games that month)
+                    return []
+                # Monthly archives can run to megabytes; orjson decodes the
+                # raw bytes directly, skipping the decode-to-str round trip
+                if ORJSON_AVAILABLE:
+                    data = orjson.loads(await response.read())
+                else:
+                    data = await response.json()
+                games = data.get('games', [])
+                archive_cache.store(
+                    username, year, month, games,
+                    last_modified=response.headers.get('Last-Modified'),
+                    etag=response.headers.get('ETag')
+                )
+                return games
+        return cached['games'] if cached else []
+    except Exception:
+        return cached['games'] if cached else []
+
+
+async def _fetch_months_async(username, months):
+    """
+    Fetch several monthly archives concurrently over one connection pool.
+
+    Args:
+        username (str): Chess.com username
+        months (list): List of (year, month) tuples, most recent first
+
+    Returns:
+        list: Per-month game lists, in the same order as `months`
+    """
+    connector = aiohttp.TCPConnector(limit=12, keepalive_timeout=30)
+    headers = {'User-Agent': Client.request_config['headers']['User-Agent']}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        tasks = [_fetch_month(session, username, year, month) for year, month in months]
+        return await asyncio.gather(*tasks)
+
+
+def _fetch_months_sequential(username, months):
+    """
+    Sequential archive fetch fallback using the blocking chessdotcom client.
+
+    Args:
+        username (str): Chess.com username
+        months (list): List of (year, month) tuples, most recent first
+
+    Returns:
+        list: Per-month game lists, in the same order as `months`
+    """
+    results = []
+    for year, month in months:
+        cached = archive_cache.load(username, year, month)
+        if archive_cache.is_immutable(cached, year, month):
+            results.append(cached['games'])
+            continue
+        try:
+            monthly_games = get_player_games_by_month(username, year, month)
+            games = monthly_games.json.get('games', [])
+            archive_cache.store(username, year, month, games)
+            results.append(games)
+        except Exception:
+            results.append(cached['games'] if cached else [])
+    return results
+
+
+# In-process memo so repeated requests for the same archive within one
+# run (overlapping windows, player comparisons, batch users) skip even
+# the disk cache
+_month_memo = {}
+
+
+def fetch_monthly_archives(username, months):
+    """
+    Fetch monthly archives, concurrently when aiohttp is available.
+
+    Results are memoized in-process by (username, year, month); only
+    unseen months hit the disk cache or the network.
+
+    Args:
+        username (str): Chess.com username
+        months (list): List of (year, month) tuples, most recent first
+
+    Returns:
+        list: Per-month game lists, in the same order as `months`
+    """
+    key_user = username.lower()
+    pending = [(year, month) for year, month in months
+               if (key_user, year, month) not in _month_memo]
+
+    if pending:
+        if AIOHTTP_AVAILABLE:
+            fetched = asyncio.run(_fetch_months_async(username, pending))
+        else:
+            fetched = _fetch_months_sequential(username, pending)
+        for (year, month), monthly_games in zip(pending, fetched):
+            _month_memo[(key_user, year, month)] = monthly_games
+
+    return [_month_memo[(key_user, year, month)] for year, month in months]
+
+
+@functools.lru_cache(maxsize=64)
+def get_player_profile_cached(username):
+    """
+    Fetch a player profile once per process.
+
+    Profiles barely change over a run; batch invocations that revisit a
+    user get the memoized response instead of another round-trip.
+
+    Args:
+        username (str): Chess.com username
+
+    Returns:
+        Response object from chessdotcom's get_player_profile
+    """
+    return get_player_profile(username)
+
+
 def get_recent_games(username, num_games=50, start_date=None, end_date=None):
     """
     Fetch recent games for a user, searching back through multiple months if needed.
@@ -405,65 +846,79 @@ def get_recent_games(username, num_games=50, start_date=None, end_date=None):
         search_start = start_date if start_date else datetime(current_date.year - 1, current_date.month, 1)
         search_end = end_date if end_date else current_date
         
-        # Generate list of year-month pairs to search
-        months_to_search = []
-        current_search = search_start.replace(day=1)
-        while current_search <= search_end:
-            months_to_search.append((current_search.year, current_search.month))
-            if current_search.month == 12:
-                current_search = current_search.replace(year=current_search.year + 1, month=1)
-            else:
-                current_search = current_search.replace(month=current_search.month + 1)
-        
-        print(f"  Searching {len(months_to_search)} months for date-filtered games...")
+        # Generate the year-month pairs via a month index: no December
+        # branch and no datetime allocation per step, same arithmetic as
+        # the recent-games window below
+        start_index = search_start.year * 12 + (search_start.month - 1)
+        end_index = search_end.year * 12 + (search_end.month - 1)
+        months_to_search = [(index // 12, index % 12 + 1)
+                            for index in range(start_index, end_index + 1)]
         
-        for year, month in months_to_search:
-            try:
-                monthly_games = get_player_games_by_month(username, year, month)
-                monthly_data = monthly_games.json.get('games', [])
-                
-                if monthly_data:
-                    # Filter games by date range if specified
-                    filtered_games = []
-                    for game in monthly_data:
-                        game_timestamp = game.get('end_time', 0)
-                        game_date = datetime.fromtimestamp(game_timestamp)
-                        
-                        # Check if game falls within date range
-                        if start_date and game_date < start_date:
-                            continue
-                        if end_date and game_date > end_date:
-                            continue
-                        
-                        filtered_games.append(game)
-                    
-                    if filtered_games:
-                        games.extend(filtered_games)
-                        print(f"  Found {len(filtered_games)} games in {year}-{month:02d} (filtered from {len(monthly_data)})")
-                
-            except Exception as e:
-                continue
+        print(f"  Searching up to {len(months_to_search)} months for date-filtered games...")
+
+        # Iterate newest-first in concurrent batches and stop once enough
+        # games are collected: unvisited months are strictly older, so
+        # they could only contribute games the final most-recent-first
+        # slice would drop anyway.
+        months_to_search.reverse()
+        batch_size = 6
+        for batch_start in range(0, len(months_to_search), batch_size):
+            month_batch = months_to_search[batch_start:batch_start + batch_size]
+            monthly_results = fetch_monthly_archives(username, month_batch)
+
+            for (year, month), monthly_data in zip(month_batch, monthly_results):
+                if not monthly_data:
+                    continue
+
+                # Filter games by date range if specified
+                filtered_games = []
+                for game in monthly_data:
+                    game_timestamp = game.get('end_time', 0)
+                    game_date = datetime.fromtimestamp(game_timestamp)
+
+                    # Check if game falls within date range
+                    if start_date and game_date < start_date:
+                        continue
+                    if end_date and game_date > end_date:
+                        continue
+
+                    filtered_games.append(game)
+
+                if filtered_games:
+                    games.extend(filtered_games)
+                    print(f"  Found {len(filtered_games)} games in {year}-{month:02d} (filtered from {len(monthly_data)})")
+
+            if len(games) >= num_games:
+                break
     else:
-        # Original logic for recent games without date filtering
+        # Fetch the last 12 months concurrently instead of one blocking
+        # request per month; total latency is roughly the slowest response.
+        # Exact month arithmetic: the old 30-days-per-offset heuristic could
+        # request the same month twice or skip one across year boundaries.
+        total_months = current_date.year * 12 + (current_date.month - 1)
+        months_to_fetch = []
         for month_offset in range(12):
-            target_date = current_date - timedelta(days=30 * month_offset)
-            year = target_date.year
-            month = target_date.month
-            
-            try:
-                monthly_games = get_player_games_by_month(username, year, month)
-                monthly_data = monthly_games.json.get('games', [])
-                
-                if monthly_data:
+            year, month = divmod(total_months - month_offset, 12)
+            months_to_fetch.append((year, month + 1))
+
+        monthly_results = fetch_monthly_archives(username, months_to_fetch)
+
+        # Merge in month order (most recent first) and stop once we have
+        # enough. Archives are chronological within a month, so only the
+        # newest `needed` games of a month are kept — a busy first month
+        # no longer drags hundreds of games through the final sort just
+        # to be sliced off.
+        for (year, month), monthly_data in zip(months_to_fetch, monthly_results):
+            if monthly_data:
+                needed = num_games - len(games)
+                if len(monthly_data) > needed:
+                    games.extend(monthly_data[-needed:])
+                else:
                     games.extend(monthly_data)
-                    print(f"  Found {len(monthly_data)} games in {year}-{month:02d}")
-                
-                # Stop if we have enough games
-                if len(games) >= num_games:
-                    break
-                    
-            except Exception as e:
-                continue
+                print(f"  Found {len(monthly_data)} games in {year}-{month:02d}")
+
+            if len(games) >= num_games:
+                break
     
     # Sort games by end_time (most recent first) and apply num_games limit
     games.sort(key=lambda x: x.get('end_time', 0), reverse=True)
@@ -474,177 +929,281 @@ def get_recent_games(username, num_games=50, start_date=None, end_date=None):
         return games
 
 
-def extract_opening_moves(pgn):
+# Compiled once at import time; parse_pgn runs once per game.
+# Matches "1. e4 e5" as well as Chess.com's commented form
+# "1. e4 {[%clk 0:02:58]} 1... e5", skipping comments and continuations.
+_MOVE_RE = re.compile(r'(\d+)\.\s*([^\s{]+)(?:\s+(?:\{[^}]*\}\s*)?(?:\d+\.\.\.\s*)?([^\s{]+))?')
+
+# Strips check/mate/annotation marks ("Bb5+" -> "Bb5") in one C-level
+# pass so the same line always lands in the same histogram bucket
+_STRIP_ANNOT = str.maketrans('', '', '+#?!')
+
+# White's raw result field mapped to the outcome from White's
+# perspective; anything unrecognized counts as a draw, matching the old
+# branch chain. One hash probe replaces two tuple-membership scans.
+_WHITE_RESULT_MAP = {
+    'win': 'win',
+    'checkmated': 'loss',
+    'timeout': 'loss',
+    'resigned': 'loss',
+    'abandoned': 'loss',
+}
+_FLIP_RESULT = {'win': 'loss', 'loss': 'win', 'draw': 'draw'}
+
+def parse_pgn(pgn, include_opening=True):
     """
-    Extract the first few moves from PGN and identify common openings.
-    
+    Extract opening moves and accuracy tags from a PGN in one pass.
+
+    The tag-pair section is walked line-by-line once for the accuracy
+    tags, then the movetext is scanned once for the opening — previously
+    these were three separate sweeps over the same string per game.
+
     Args:
         pgn (str): PGN notation of the game
-        
+        include_opening (bool): Parse the movetext for opening moves
+
     Returns:
-        tuple: (first_moves_string, opening_name)
+        tuple: (first_moves_string, opening_name, accuracy_white,
+                accuracy_black)
     """
+    accuracy_white = None
+    accuracy_black = None
+
     if not pgn:
-        return "N/A", "Unknown"
-    
+        return "N/A", "Unknown", accuracy_white, accuracy_black
+
+    # Tag-pair section ends at the first blank line
+    header_end = pgn.find('\n\n')
+    headers = pgn[:header_end] if header_end != -1 else pgn
+
+    for line in headers.split('\n'):
+        if line.startswith('[WhiteAccuracy'):
+            try:
+                accuracy_white = float(line.split('"', 2)[1])
+            except (IndexError, ValueError):
+                pass
+        elif line.startswith('[BlackAccuracy'):
+            try:
+                accuracy_black = float(line.split('"', 2)[1])
+            except (IndexError, ValueError):
+                pass
+
+    if not include_opening or '1.' not in pgn:
+        # No movetext at all (e.g. aborted game): skip the regex engine
+        return "N/A", "Unknown", accuracy_white, accuracy_black
+
     try:
-        # Find the moves section
-        lines = pgn.split('\n')
-        moves_lines = []
-        in_moves = False
-        
-        for line in lines:
-            if line.strip() and not line.startswith('['):
-                in_moves = True
-            if in_moves:
-                moves_lines.append(line)
-        
-        moves_text = ' '.join(moves_lines)
-        
-        # Clean up the moves - remove annotations, timestamps, etc.
-        moves_text = re.sub(r'\{[^}]*\}', '', moves_text)  # Remove comments
-        moves_text = re.sub(r'%clk \d+:\d+:\d+', '', moves_text)  # Remove clock times
-        moves_text = re.sub(r'\s+', ' ', moves_text)  # Normalize whitespace
-        
-        # Extract first 6 moves (3 for each side)
-        move_pattern = r'(\d+\.)\s*(\S+)\s*(\S+)?'
-        matches = re.findall(move_pattern, moves_text)
-        
-        if not matches:
-            return "N/A", "Unknown"
-        
-        # Format the first 3 moves
+        # Three moves (even with clock comments) fit well inside 256
+        # bytes, so the regex scan is O(1) regardless of PGN length.
+        moves_text = pgn[header_end:header_end + 256] if header_end != -1 else pgn[:256]
+
+        # Single scan, stopping after the first 3 moves
         first_moves = []
-        for i, (move_num, white_move, black_move) in enumerate(matches[:3]):
-            if white_move:
-                first_moves.append(f"{move_num} {white_move}")
-                if black_move:
-                    first_moves.append(black_move)
-        
+        for match in _MOVE_RE.finditer(moves_text):
+            move_num, white_move, black_move = match.groups()
+            first_moves.append(f"{move_num}. {white_move.translate(_STRIP_ANNOT)}")
+            if black_move:
+                first_moves.append(black_move.translate(_STRIP_ANNOT))
+            if int(move_num) >= 3:
+                break
+
+        if not first_moves:
+            return "N/A", "Unknown", accuracy_white, accuracy_black
+
         first_moves_str = ' '.join(first_moves)
-        
+
         # Simple opening classification
         opening_name = classify_opening(first_moves_str)
-        
-        return first_moves_str, opening_name
-        
+
+        return first_moves_str, opening_name, accuracy_white, accuracy_black
+
     except Exception as e:
-        return "Error parsing", "Unknown"
+        return "Error parsing", "Unknown", accuracy_white, accuracy_black
+
 
+# Opening families as a prefix trie over the opening plies, built once at
+# import time. Nested dicts branch on the next ply; a string value is a
+# final classification, and the None key holds the family name for lines
+# that stop (or diverge) at that depth.
+_OPENING_TRIE = {
+    'e4': {
+        'e5': {
+            None: "King's Pawn Game",
+            'nf3': {
+                'nc6': {
+                    None: "Italian Game / Spanish Opening",
+                    'bc4': "Italian Game",
+                    'bb5': "Spanish Opening (Ruy Lopez)",
+                },
+            },
+            'bc4': "Italian Game",
+            'bb5': "Spanish Opening (Ruy Lopez)",
+        },
+        'c5': "Sicilian Defense",
+        'e6': "French Defense",
+        'c6': "Caro-Kann Defense",
+    },
+    'd4': {
+        'd5': "Queen's Pawn Game",
+        'nf6': {
+            None: "Indian Defense",
+            'c4': "English Opening / Queen's Indian",
+        },
+    },
+    'nf3': "Reti Opening",
+    'c4': "English Opening",
+    'f4': "Bird's Opening",
+}
 
+
+@functools.lru_cache(maxsize=256)
 def classify_opening(moves_str):
     """
     Classify chess opening based on first moves.
-    
+
+    Walks the opening trie one ply at a time, keeping the deepest family
+    name passed on the way, so classification cost is O(plies) regardless
+    of how many openings the trie knows. Pure function, so repeated
+    prefixes (players cluster heavily on a few openings) are answered
+    from the LRU cache after the first call.
+
     Args:
         moves_str (str): String of first moves
-        
+
     Returns:
         str: Opening name
     """
-    moves_lower = moves_str.lower()
-    
-    # Common opening patterns
-    if 'e4 e5' in moves_lower:
-        if 'nf3 nc6' in moves_lower:
-            return "Italian Game / Spanish Opening"
-        elif 'bc4' in moves_lower:
-            return "Italian Game"
-        elif 'bb5' in moves_lower:
-            return "Spanish Opening (Ruy Lopez)"
-        else:
-            return "King's Pawn Game"
-    elif 'e4 c5' in moves_lower:
-        return "Sicilian Defense"
-    elif 'e4 e6' in moves_lower:
-        return "French Defense"
-    elif 'e4 c6' in moves_lower:
-        return "Caro-Kann Defense"
-    elif 'd4 d5' in moves_lower:
-        return "Queen's Pawn Game"
-    elif 'd4 nf6' in moves_lower:
-        if 'c4' in moves_lower:
-            return "English Opening / Queen's Indian"
-        else:
-            return "Indian Defense"
-    elif 'nf3' in moves_lower and moves_lower.startswith('1. nf3'):
-        return "Reti Opening"
-    elif 'c4' in moves_lower and moves_lower.startswith('1. c4'):
-        return "English Opening"
-    elif 'f4' in moves_lower and moves_lower.startswith('1. f4'):
-        return "Bird's Opening"
-    else:
-        return "Other Opening"
+    # Drop move numbers ("1.", "2.", ...), keep the plies themselves
+    plies = [t for t in moves_str.lower().split() if not t.endswith('.')]
+
+    node = _OPENING_TRIE
+    name = "Other Opening"
+    for ply in plies:
+        child = node.get(ply)
+        if child is None:
+            break
+        if isinstance(child, str):
+            return child
+        node = child
+        name = node.get(None, name)
+    return name
+
+
+@functools.lru_cache(maxsize=64)
+def classify_time_control(time_control):
+    """
+    Map a raw Chess.com time_control string to a named bucket.
+
+    Raw values like '600', '60+1' or '1/86400' produce dozens of distinct
+    histogram keys; the summary only needs the speed class. Cached since
+    the same few raw strings recur across a batch of games.
+
+    Args:
+        time_control (str): Raw time_control field from the API
+
+    Returns:
+        str: One of 'bullet', 'blitz', 'rapid', 'classical', 'daily',
+             or 'unknown'
+    """
+    if not time_control or time_control == 'unknown':
+        return 'unknown'
+    if '/' in time_control:
+        return 'daily'
+    try:
+        base_seconds = int(time_control.split('+', 1)[0])
+    except ValueError:
+        return 'unknown'
+    if base_seconds < 180:
+        return 'bullet'
+    elif base_seconds < 600:
+        return 'blitz'
+    elif base_seconds < 1800:
+        return 'rapid'
+    return 'classical'
 
 
-def analyze_game(game, username):
+@dataclass(slots=True)
+class AnalyzedGame:
+    """
+    One analyzed game.
+
+    Slots keep per-record memory at fixed-array size instead of a
+    17-key dict per game, which matters at --num-games in the thousands.
+    """
+    game_id: str
+    date: str
+    end_time: int
+    player_color: str
+    player_rating: int
+    opponent_username: str
+    opponent_rating: int
+    result: str
+    termination: str
+    time_control: str
+    time_control_bucket: str
+    rated: bool
+    rules: str
+    opening_moves: str
+    opening_name: str
+    accuracy_white: float
+    accuracy_black: float
+    pgn: str
+    url: str
+
+
+def analyze_game(game, username, include_opening=True, username_lower=None, keep_pgn=True):
     """
     Analyze a single game and extract relevant information.
-    
+
     Args:
         game (dict): Game data from Chess.com API
         username (str): The username we're analyzing for
-        
+        include_opening (bool): Parse the PGN for opening moves. Pass
+            False when only results/ratings are needed; PGN parsing
+            dominates the per-game cost.
+        username_lower (str): Precomputed username.lower(); callers in a
+            loop should pass it once instead of re-lowering per game.
+        keep_pgn (bool): Retain the raw PGN on the returned dict. Only
+            the database-storage path reads it afterwards; dropping it
+            saves several KB per game on large runs.
+
     Returns:
-        dict: Analyzed game data
+        AnalyzedGame: Analyzed game record
     """
-    # Determine player's color and role
-    white_player = game.get('white', {}).get('username', '').lower()
-    black_player = game.get('black', {}).get('username', '').lower()
-    
-    if username.lower() == white_player:
+    if username_lower is None:
+        username_lower = username.lower()
+
+    # Determine player's color and role. Chess.com usernames are usually
+    # consistently cased, so try the plain == first and only fall back to
+    # allocating a lowered copy when it misses.
+    white_player = game.get('white', {}).get('username', '')
+    black_player = game.get('black', {}).get('username', '')
+
+    if white_player == username or white_player.lower() == username_lower:
         player_color = 'white'
         player_rating = game.get('white', {}).get('rating')
-        opponent_username = black_player
+        opponent_username = black_player.lower()
         opponent_rating = game.get('black', {}).get('rating')
     else:
         player_color = 'black'
         player_rating = game.get('black', {}).get('rating')
-        opponent_username = white_player
+        opponent_username = white_player.lower()
         opponent_rating = game.get('white', {}).get('rating')
     
-    # Determine result from player's perspective
+    # Determine result from player's perspective via dict lookups
     result = game.get('white', {}).get('result', 'unknown')
+    white_outcome = _WHITE_RESULT_MAP.get(result, 'draw')
     if player_color == 'white':
-        if result == 'win':
-            player_result = 'win'
-        elif result in ['checkmated', 'timeout', 'resigned', 'abandoned']:
-            player_result = 'loss'
-        else:
-            player_result = 'draw'
+        player_result = white_outcome
     else:
-        if result == 'win':
-            player_result = 'loss'
-        elif result in ['checkmated', 'timeout', 'resigned', 'abandoned']:
-            player_result = 'win'
-        else:
-            player_result = 'draw'
+        player_result = _FLIP_RESULT[white_outcome]
     
-    # Extract PGN and opening moves
+    # One pass over the PGN covers opening moves and accuracy tags (the
+    # opening scan is skipped entirely for aggregate-only callers)
     pgn = game.get('pgn', '')
-    opening_moves, opening_name = extract_opening_moves(pgn)
-    
-    # Extract accuracies if available
-    accuracy_white = None
-    accuracy_black = None
-    
-    # Look for accuracy in PGN headers
-    if pgn:
-        white_accuracy_match = re.search(r'\[WhiteAccuracy "([^"]+)"\]', pgn)
-        black_accuracy_match = re.search(r'\[BlackAccuracy "([^"]+)"\]', pgn)
-        
-        if white_accuracy_match:
-            try:
-                accuracy_white = float(white_accuracy_match.group(1))
-            except:
-                pass
-                
-        if black_accuracy_match:
-            try:
-                accuracy_black = float(black_accuracy_match.group(1))
-            except:
-                pass
-    
+    opening_moves, opening_name, accuracy_white, accuracy_black = parse_pgn(
+        pgn, include_opening=include_opening)
+
     # Format date
     end_time = game.get('end_time')
     if end_time:
@@ -652,38 +1211,210 @@ def analyze_game(game, username):
     else:
         game_date = 'Unknown'
     
+    return AnalyzedGame(
+        game_id=game.get('uuid', 'unknown'),
+        date=game_date,
+        end_time=end_time,
+        player_color=player_color,
+        player_rating=player_rating,
+        opponent_username=opponent_username,
+        opponent_rating=opponent_rating,
+        result=player_result,
+        termination=game.get('white', {}).get('result', 'unknown'),
+        time_control=game.get('time_control', 'unknown'),
+        time_control_bucket=classify_time_control(game.get('time_control', 'unknown')),
+        rated=game.get('rated', False),
+        rules=game.get('rules', 'chess'),
+        opening_moves=opening_moves,
+        opening_name=opening_name,
+        accuracy_white=accuracy_white,
+        accuracy_black=accuracy_black,
+        pgn=pgn if keep_pgn else None,
+        url=game.get('url', '')
+    )
+
+
+# Rating summary computed inline during aggregation. current is the
+# rating of the newest game (the analyzed list is sorted newest-first),
+# not whatever happens to sit at the end of a ratings column.
+RatingStats = namedtuple('RatingStats', ['current', 'highest', 'lowest', 'average', 'count'])
+
+_EMPTY_RATING_STATS = RatingStats(None, None, None, None, 0)
+
+
+def _new_opening_stats():
+    """Fresh per-opening counter row for the aggregation defaultdict."""
+    return {'count': 0, 'wins': 0, 'losses': 0, 'draws': 0}
+
+
+def _aggregate(analyzed_games):
+    """
+    Fold all per-game statistics into a single traversal.
+
+    Args:
+        analyzed_games (list): Analysis dicts from analyze_game
+
+    Returns:
+        dict: win/loss/draw counts, rating summary, accuracy columns, the
+              time-control Counter and the per-opening result table
+    """
+    wins = losses = draws = 0
+    current_rating = None
+    rating_min = rating_max = None
+    rating_sum = rating_count = 0
+    white_sum = black_sum = 0.0
+    white_n = black_n = 0
+    time_controls = Counter()
+    openings = defaultdict(_new_opening_stats)
+
+    for game in analyzed_games:
+        result = game.result
+        if result == 'win':
+            wins += 1
+        elif result == 'loss':
+            losses += 1
+        elif result == 'draw':
+            draws += 1
+
+        rating = game.player_rating
+        if rating:
+            # Running min/max/sum instead of a ratings list scanned
+            # three more times afterwards
+            if current_rating is None:
+                current_rating = rating
+                rating_min = rating_max = rating
+            elif rating < rating_min:
+                rating_min = rating
+            elif rating > rating_max:
+                rating_max = rating
+            rating_sum += rating
+            rating_count += 1
+        # Accuracies only ever feed an average, so keep running totals
+        # instead of materializing two O(n) lists
+        if game.accuracy_white is not None:
+            white_sum += game.accuracy_white
+            white_n += 1
+        if game.accuracy_black is not None:
+            black_sum += game.accuracy_black
+            black_n += 1
+
+        # Aggregate on the named bucket: a handful of keys instead of one
+        # per raw '60+1'-style string (raw value stays on the record)
+        time_controls[game.time_control_bucket] += 1
+
+        # Opening table tracks per-result counters, not just counts
+        stats = openings[game.opening_name]
+        stats['count'] += 1
+        if result == 'win':
+            stats['wins'] += 1
+        elif result == 'loss':
+            stats['losses'] += 1
+        elif result == 'draw':
+            stats['draws'] += 1
+
+    if rating_count:
+        rating_stats = RatingStats(
+            current_rating, rating_max, rating_min,
+            rating_sum / rating_count, rating_count)
+    else:
+        rating_stats = _EMPTY_RATING_STATS
+
+    return {
+        'wins': wins,
+        'losses': losses,
+        'draws': draws,
+        'rating_stats': rating_stats,
+        'white_accuracy_avg': (white_sum / white_n) if white_n else None,
+        'black_accuracy_avg': (black_sum / black_n) if black_n else None,
+        'time_controls': time_controls,
+        'openings': openings
+    }
+
+
+# Below this many games the fused Python pass beats the DataFrame
+# construction cost, so pandas is only brought in for large runs
+_PANDAS_AGGREGATION_THRESHOLD = 200
+
+
+def _aggregate_pandas(analyzed_games):
+    """
+    Vectorized variant of _aggregate for large game counts.
+
+    Builds one DataFrame and computes every histogram and column with
+    C-level value_counts/groupby instead of interpreted per-game work.
+    Imports pandas lazily and falls back to the fused Python pass when it
+    is not installed.
+
+    Args:
+        analyzed_games (list): Analysis dicts from analyze_game
+
+    Returns:
+        dict: Same shape as _aggregate()
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return _aggregate(analyzed_games)
+
+    df = pd.DataFrame({
+        'result': [game.result for game in analyzed_games],
+        'player_rating': [game.player_rating for game in analyzed_games],
+        'accuracy_white': [game.accuracy_white for game in analyzed_games],
+        'accuracy_black': [game.accuracy_black for game in analyzed_games],
+        'time_control_bucket': [game.time_control_bucket for game in analyzed_games],
+        'opening_name': [game.opening_name for game in analyzed_games]
+    })
+
+    result_counts = df['result'].value_counts()
+
+    openings = {}
+    opening_results = df.groupby('opening_name')['result'].value_counts().unstack(fill_value=0)
+    for opening, row in opening_results.iterrows():
+        openings[opening] = {
+            'count': int(row.sum()),
+            'wins': int(row.get('win', 0)),
+            'losses': int(row.get('loss', 0)),
+            'draws': int(row.get('draw', 0))
+        }
+
+    white_col = df['accuracy_white'].dropna()
+    black_col = df['accuracy_black'].dropna()
+
+    rating_col = df['player_rating'].dropna()
+    if len(rating_col):
+        # First row is the newest game; the analyzed list arrives sorted
+        rating_stats = RatingStats(
+            rating_col.iloc[0], rating_col.max(), rating_col.min(),
+            float(rating_col.mean()), len(rating_col))
+    else:
+        rating_stats = _EMPTY_RATING_STATS
+
     return {
-        'game_id': game.get('uuid', 'unknown'),
-        'date': game_date,
-        'end_time': end_time,
-        'player_color': player_color,
-        'player_rating': player_rating,
-        'opponent_username': opponent_username,
-        'opponent_rating': opponent_rating,
-        'result': player_result,
-        'termination': game.get('white', {}).get('result', 'unknown'),
-        'time_control': game.get('time_control', 'unknown'),
-        'rated': game.get('rated', False),
-        'rules': game.get('rules', 'chess'),
-        'opening_moves': opening_moves,
-        'opening_name': opening_name,
-        'accuracy_white': accuracy_white,
-        'accuracy_black': accuracy_black,
-        'pgn': pgn,
-        'url': game.get('url', '')
+        'wins': int(result_counts.get('win', 0)),
+        'losses': int(result_counts.get('loss', 0)),
+        'draws': int(result_counts.get('draw', 0)),
+        'rating_stats': rating_stats,
+        'white_accuracy_avg': float(white_col.mean()) if len(white_col) else None,
+        'black_accuracy_avg': float(black_col.mean()) if len(black_col) else None,
+        'time_controls': Counter(df['time_control_bucket'].value_counts().to_dict()),
+        'openings': openings
     }
 
 
-def analyze_user_games(username, num_games=50, save_to_database=False, start_date=None, end_date=None):
+def analyze_user_games(username, num_games=50, save_to_database=False, start_date=None, end_date=None,
+                       db_connection=None):
     """
     Analyze recent games for a user with comprehensive statistics and optional database storage.
-    
+
     Args:
         username (str): Chess.com username
         num_games (int): Number of recent games to analyze
         save_to_database (bool): Whether to save results to database
         start_date (datetime): Optional start date filter (inclusive)
         end_date (datetime): Optional end date filter (inclusive)
+        db_connection: Optional open database connection. Batch drivers
+            pass one shared connection so each user doesn't pay the
+            TCP/TLS/Azure-AD connect cost; the caller owns its lifetime.
     """
     print(f"\n📊 Advanced Chess.com Game Analysis for: {username}")
     
@@ -699,18 +1430,20 @@ def analyze_user_games(username, num_games=50, save_to_database=False, start_dat
     
     print(f"🔍 Analyzing up to {num_games} games{date_info}...")
     
-    # Database connection
-    db_connection = None
-    if save_to_database and PYODBC_AVAILABLE:
+    # Database connection: use the shared one when provided, otherwise
+    # open (and later close) our own
+    owns_connection = False
+    if db_connection is None and save_to_database:
         db_connection = get_database_connection()
         if db_connection:
+            owns_connection = True
             print("✅ Connected to database")
         else:
             print("❌ Database connection failed, proceeding without database")
     
     try:
-        # Get player profile
-        profile = get_player_profile(username)
+        # Get player profile (memoized per process)
+        profile = get_player_profile_cached(username)
         profile_data = profile.json
         
         print(f"👤 Player: {profile_data.get('name', username)}")
@@ -730,19 +1463,57 @@ def analyze_user_games(username, num_games=50, save_to_database=False, start_dat
     
     print(f"✅ Found {len(games)} games")
     
-    # Analyze games
+    # Analyze games; previously parsed games come straight from the
+    # parsed-game cache and only unseen URLs pay the PGN-parsing cost.
+    # Database rows stream out through a bounded buffer as the loop
+    # runs, so resident PGN memory is O(flush size), not O(num_games).
     analyzed_games = []
+    pending_db = []
+    stored_total = 0
+    store_elapsed = 0.0
+    store_failed = False
+    username_lower = username.lower()
+    keep_pgn = db_connection is not None
+    parse_cache = analysis_cache.connect()
+
+    def flush_pending():
+        nonlocal stored_total, store_failed, store_elapsed
+        flush_start = time.perf_counter()
+        stored = store_games_batch(db_connection, username, pending_db)
+        store_elapsed += time.perf_counter() - flush_start
+        stored_total += stored
+        store_failed = store_failed or not stored
+        # Nothing downstream reads the PGN once the rows are on the
+        # server; dropping it frees several KB per game immediately
+        for flushed in pending_db:
+            flushed.pgn = None
+        pending_db.clear()
+
     for game in games:
-        analysis = analyze_game(game, username)
+        cached = analysis_cache.lookup(parse_cache, username, game.get('url'))
+        if cached is not None:
+            analysis = AnalyzedGame(pgn=game.get('pgn', '') if keep_pgn else None, **cached)
+        else:
+            analysis = analyze_game(game, username, username_lower=username_lower, keep_pgn=keep_pgn)
+            analysis_cache.store(parse_cache, username, analysis)
         analyzed_games.append(analysis)
-        
-        # Store in database if enabled
+
         if db_connection:
-            if store_game_in_database(db_connection, username, analysis):
-                print(f"  ✅ Stored game {analysis['game_id'][:8]}... in database")
-            else:
-                print(f"  ❌ Failed to store game {analysis['game_id'][:8]}...")
-    
+            pending_db.append(analysis)
+            if len(pending_db) >= _DB_FLUSH_ROWS:
+                flush_pending()
+
+    analysis_cache.close(parse_cache)
+
+    # Flush the remainder and report the whole run in one line
+    if db_connection:
+        if pending_db:
+            flush_pending()
+        if stored_total and not store_failed:
+            print(f"  ✅ Stored {stored_total} games in database in {store_elapsed:.2f}s")
+        else:
+            print(f"  ❌ Failed to store games in database")
+
     # Update user statistics in database
     if db_connection:
         if update_user_statistics_in_database(db_connection, username):
@@ -755,114 +1526,114 @@ def analyze_user_games(username, num_games=50, save_to_database=False, start_dat
     if db_connection:
         historical_stats = get_user_statistics_from_database(db_connection, username)
     
-    # Calculate statistics
+    # Calculate statistics: one fused pass collects every counter and
+    # column, then the numeric reductions run vectorized on the columns
     total_games = len(analyzed_games)
-    wins = sum(1 for game in analyzed_games if game['result'] == 'win')
-    losses = sum(1 for game in analyzed_games if game['result'] == 'loss')
-    draws = sum(1 for game in analyzed_games if game['result'] == 'draw')
-    
+    if total_games >= _PANDAS_AGGREGATION_THRESHOLD:
+        aggregates = _aggregate_pandas(analyzed_games)
+    else:
+        aggregates = _aggregate(analyzed_games)
+    wins = aggregates['wins']
+    losses = aggregates['losses']
+    draws = aggregates['draws']
+    time_controls = aggregates['time_controls']
+    openings = aggregates['openings']
+
     win_rate = (wins / total_games * 100) if total_games > 0 else 0
-    
-    # Rating analysis
-    ratings = [game['player_rating'] for game in analyzed_games if game['player_rating']]
-    if ratings:
-        current_rating = ratings[-1]  # Most recent game
-        highest_rating = max(ratings)
-        lowest_rating = min(ratings)
-        avg_rating = sum(ratings) / len(ratings)
+
+    # Rating analysis (computed inline during aggregation)
+    rating_stats = aggregates['rating_stats']
+    if rating_stats.count:
+        current_rating = int(rating_stats.current)
+        highest_rating = int(rating_stats.highest)
+        lowest_rating = int(rating_stats.lowest)
+        avg_rating = rating_stats.average
     else:
         current_rating = highest_rating = lowest_rating = avg_rating = "N/A"
-    
-    # Time control analysis
-    time_controls = {}
-    for game in analyzed_games:
-        tc = game['time_control']
-        time_controls[tc] = time_controls.get(tc, 0) + 1
-    
-    # Opening analysis
-    openings = {}
-    for game in analyzed_games:
-        opening = game['opening_name']
-        if opening not in openings:
-            openings[opening] = {'count': 0, 'wins': 0, 'losses': 0, 'draws': 0}
-        openings[opening]['count'] += 1
-        
-        # Update the appropriate result counter
-        if game['result'] == 'win':
-            openings[opening]['wins'] += 1
-        elif game['result'] == 'loss':
-            openings[opening]['losses'] += 1
-        elif game['result'] == 'draw':
-            openings[opening]['draws'] += 1
-    
-    # Accuracy analysis
-    white_accuracies = [game['accuracy_white'] for game in analyzed_games if game['accuracy_white'] is not None]
-    black_accuracies = [game['accuracy_black'] for game in analyzed_games if game['accuracy_black'] is not None]
-    
-    # Print comprehensive analysis
-    print(f"\n" + "="*60)
-    print(f"📊 COMPREHENSIVE GAME ANALYSIS")
-    print(f"="*60)
-    
-    print(f"\n🎯 OVERALL PERFORMANCE:")
-    print(f"   Total Games: {total_games}")
-    print(f"   Wins: {wins} ({win_rate:.1f}%)")
-    print(f"   Losses: {losses} ({losses/total_games*100:.1f}%)")
-    print(f"   Draws: {draws} ({draws/total_games*100:.1f}%)")
-    
+
+    # Accuracy analysis (averaged inline during aggregation)
+    white_accuracy_avg = aggregates['white_accuracy_avg']
+    black_accuracy_avg = aggregates['black_accuracy_avg']
+    
+    # Build the whole report as lines and flush them in one stdout write
+    # instead of one line-buffered syscall per print
+    rows = [
+        "\n" + "=" * 60,
+        "📊 COMPREHENSIVE GAME ANALYSIS",
+        "=" * 60,
+        "\n🎯 OVERALL PERFORMANCE:",
+        f"   Total Games: {total_games}",
+        f"   Wins: {wins} ({win_rate:.1f}%)",
+        f"   Losses: {losses} ({losses/total_games*100:.1f}%)",
+        f"   Draws: {draws} ({draws/total_games*100:.1f}%)"
+    ]
+
     if isinstance(current_rating, (int, float)):
-        print(f"\n📈 RATING STATISTICS:")
-        print(f"   Current Rating: {current_rating}")
-        print(f"   Highest Rating: {highest_rating}")
-        print(f"   Lowest Rating: {lowest_rating}")
-        print(f"   Average Rating: {avg_rating:.1f}")
-    
-    print(f"\n⏱️  TIME CONTROL DISTRIBUTION:")
-    for tc, count in sorted(time_controls.items(), key=lambda x: x[1], reverse=True):
-        print(f"   {tc}: {count} games ({count/total_games*100:.1f}%)")
-    
-    print(f"\n🎪 OPENING ANALYSIS:")
-    for opening, stats in sorted(openings.items(), key=lambda x: x[1]['count'], reverse=True)[:10]:
-        wr = (stats['wins'] / stats['count'] * 100) if stats['count'] > 0 else 0
-        print(f"   {opening}: {stats['count']} games (Win rate: {wr:.1f}%)")
-    
-    if white_accuracies or black_accuracies:
-        print(f"\n🎯 ACCURACY STATISTICS:")
-        if white_accuracies:
-            print(f"   Average as White: {sum(white_accuracies)/len(white_accuracies):.1f}%")
-        if black_accuracies:
-            print(f"   Average as Black: {sum(black_accuracies)/len(black_accuracies):.1f}%")
-    
+        rows.append(f"\n📈 RATING STATISTICS:")
+        rows.append(f"   Current Rating: {current_rating}")
+        rows.append(f"   Highest Rating: {highest_rating}")
+        rows.append(f"   Lowest Rating: {lowest_rating}")
+        rows.append(f"   Average Rating: {avg_rating:.1f}")
+
+    rows.append(f"\n⏱️  TIME CONTROL DISTRIBUTION:")
+    for tc, count in time_controls.most_common():
+        rows.append(f"   {tc}: {count} games ({count/total_games*100:.1f}%)")
+
+    rows.append(f"\n🎪 OPENING ANALYSIS:")
+    # Bounded top-k select over predecorated (count, name, stats) tuples:
+    # comparisons stay at C level with no per-comparison key callback,
+    # and names are unique so ties never reach the stats dict
+    decorated = ((stats['count'], name, stats) for name, stats in openings.items())
+    for count, opening, stats in heapq.nlargest(10, decorated):
+        wr = (stats['wins'] / count * 100) if count > 0 else 0
+        rows.append(f"   {opening}: {count} games (Win rate: {wr:.1f}%)")
+
+    if white_accuracy_avg is not None or black_accuracy_avg is not None:
+        rows.append(f"\n🎯 ACCURACY STATISTICS:")
+        if white_accuracy_avg is not None:
+            rows.append(f"   Average as White: {white_accuracy_avg:.1f}%")
+        if black_accuracy_avg is not None:
+            rows.append(f"   Average as Black: {black_accuracy_avg:.1f}%")
+
     # Show historical comparison if available
     if historical_stats:
-        print(f"\n📚 HISTORICAL DATABASE STATISTICS:")
-        print(f"   Total Games in DB: {historical_stats['total_games']}")
-        print(f"   All-time Wins: {historical_stats['wins']}")
-        print(f"   All-time Losses: {historical_stats['losses']}")
-        print(f"   All-time Draws: {historical_stats['draws']}")
+        rows.append(f"\n📚 HISTORICAL DATABASE STATISTICS:")
+        rows.append(f"   Total Games in DB: {historical_stats['total_games']}")
+        rows.append(f"   All-time Wins: {historical_stats['wins']}")
+        rows.append(f"   All-time Losses: {historical_stats['losses']}")
+        rows.append(f"   All-time Draws: {historical_stats['draws']}")
         if historical_stats['avg_accuracy_white']:
-            print(f"   Historical Avg Accuracy (White): {historical_stats['avg_accuracy_white']:.1f}%")
+            rows.append(f"   Historical Avg Accuracy (White): {historical_stats['avg_accuracy_white']:.1f}%")
         if historical_stats['avg_accuracy_black']:
-            print(f"   Historical Avg Accuracy (Black): {historical_stats['avg_accuracy_black']:.1f}%")
-        print(f"   Highest Rating Ever: {historical_stats['highest_rating']}")
-    
+            rows.append(f"   Historical Avg Accuracy (Black): {historical_stats['avg_accuracy_black']:.1f}%")
+        rows.append(f"   Highest Rating Ever: {historical_stats['highest_rating']}")
+
     # Recent games details
-    print(f"\n📋 RECENT GAMES DETAILS:")
-    print(f"{'Date':<12} {'Opponent':<15} {'Color':<6} {'Result':<6} {'Rating':<6} {'Opening':<20}")
-    print("-" * 80)
-    
-    for game in analyzed_games[-10:]:  # Show last 10 games
-        date_str = game['date'][:10] if len(game['date']) >= 10 else game['date']
-        opponent = game['opponent_username'][:14] if game['opponent_username'] else 'Unknown'
-        color = game['player_color'][:5]
-        result = game['result']
-        rating = str(game['player_rating']) if game['player_rating'] else 'N/A'
-        opening = game['opening_name'][:19] if game['opening_name'] else 'Unknown'
-        
-        print(f"{date_str:<12} {opponent:<15} {color:<6} {result:<6} {rating:<6} {opening:<20}")
+    rows.append(f"\n📋 RECENT GAMES DETAILS:")
+    rows.append(f"{'Date':<12} {'Opponent':<15} {'Color':<6} {'Result':<6} {'Rating':<6} {'Opening':<20}")
+    rows.append("-" * 80)
+
+    # One C-level attrgetter call fetches all display fields per row
+    row_fields = operator.attrgetter(
+        'date', 'opponent_username', 'player_color', 'result',
+        'player_rating', 'opening_name')
+
+    # Iterate the last 10 games in place instead of allocating a slice
+    for game in itertools.islice(analyzed_games, max(0, total_games - 10), None):
+        date, opponent, color, result, rating, opening = row_fields(game)
+        # Format specs like <15.14 truncate and pad in one C-level op,
+        # avoiding an intermediate slice allocation per field
+        rows.append(
+            f"{date:<12.10} {opponent or 'Unknown':<15.14} "
+            f"{color:<6.5} {result:<6} "
+            f"{rating or 'N/A':<6} {opening or 'Unknown':<20.19}"
+        )
+
+    sys.stdout.write('\n'.join(rows) + '\n')
     
-    # Close database connection
-    if db_connection:
+    # Close the connection only if we opened it; shared connections are
+    # owned by the batch driver
+    if db_connection and owns_connection:
         db_connection.close()
         print(f"\n✅ Database connection closed")
     
@@ -880,48 +1651,42 @@ def main():
                        help='Enable database storage (requires database_config.json)')
     parser.add_argument('--delay', type=float, default=2.0,
                        help='Delay in seconds between processing users (default: 2.0, helps with API rate limits)')
-    parser.add_argument('--start-date', type=str,
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of users to analyze concurrently (default: 1, sequential). '
+                            'Keep small (3-4) to respect Chess.com rate limits.')
+    # fromisoformat as the type= validator: parsing happens once inside
+    # parse_args and bad values get argparse's usual error + exit code 2
+    parser.add_argument('--start-date', type=datetime.fromisoformat,
                        help='Start date for game filtering (YYYY-MM-DD format, e.g., 2024-01-01)')
-    parser.add_argument('--end-date', type=str,
+    parser.add_argument('--end-date', type=datetime.fromisoformat,
                        help='End date for game filtering (YYYY-MM-DD format, e.g., 2024-12-31)')
-    parser.add_argument('--start-time', type=str,
+    parser.add_argument('--start-time', type=dtime.fromisoformat,
                        help='Start time for game filtering (HH:MM format, e.g., 14:30). Used with start-date.')
-    parser.add_argument('--end-time', type=str,
+    parser.add_argument('--end-time', type=dtime.fromisoformat,
                        help='End time for game filtering (HH:MM format, e.g., 18:45). Used with end-date.')
-    
+
     args = parser.parse_args()
-    
+
     print("🔥 Chess.com Advanced Game Analysis with Database Integration")
     print("="*60)
-    
-    # Parse date and time arguments
+
+    # Combine the already-parsed date and time arguments
     start_datetime = None
     end_datetime = None
-    
-    try:
-        if args.start_date:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
-            if args.start_time:
-                start_time = datetime.strptime(args.start_time, '%H:%M').time()
-                start_datetime = datetime.combine(start_date.date(), start_time)
-            else:
-                start_datetime = start_date
-                
-        if args.end_date:
-            end_date = datetime.strptime(args.end_date, '%Y-%m-%d')
-            if args.end_time:
-                end_time = datetime.strptime(args.end_time, '%H:%M').time()
-                end_datetime = datetime.combine(end_date.date(), end_time)
-            else:
-                # Set to end of day if no time specified
-                end_datetime = datetime.combine(end_date.date(), datetime.max.time())
-                
-    except ValueError as e:
-        print(f"❌ Error parsing date/time: {e}")
-        print("   Date format: YYYY-MM-DD (e.g., 2024-01-01)")
-        print("   Time format: HH:MM (e.g., 14:30)")
-        return
-    
+
+    if args.start_date:
+        if args.start_time:
+            start_datetime = datetime.combine(args.start_date.date(), args.start_time)
+        else:
+            start_datetime = args.start_date
+
+    if args.end_date:
+        if args.end_time:
+            end_datetime = datetime.combine(args.end_date.date(), args.end_time)
+        else:
+            # Set to end of day if no time specified
+            end_datetime = datetime.combine(args.end_date.date(), dtime.max)
+
     # Validate date range
     if start_datetime and end_datetime and start_datetime > end_datetime:
         print("❌ Start date/time cannot be after end date/time")
@@ -931,10 +1696,10 @@ def main():
     save_to_db = False
     
     if args.use_database:
-        if not PYODBC_AVAILABLE:
+        if _load_pyodbc() is None:
             print("❌ pyodbc not available. Install with: pip install pyodbc")
             print("   Database features will be disabled.")
-        elif not AZURE_AUTH_AVAILABLE:
+        elif _load_azure_credential() is None:
             print("❌ azure-identity not available. Install with: pip install azure-identity")
             print("   Database features will be disabled.")
         else:
@@ -942,9 +1707,8 @@ def main():
             
             # Load and validate config
             config = load_database_config()
-            required_fields = ['server', 'database', 'tenant_id', 'client_id', 'client_secret']
-            missing_fields = [field for field in required_fields if not config.get(field) or config[field].startswith('your-')]
-            
+            missing_fields = _missing_config_fields(config)
+
             if missing_fields:
                 print(f"❌ Please edit {DATABASE_CONFIG_FILE} and provide values for: {', '.join(missing_fields)}")
                 print("   Database features will be disabled.")
@@ -954,13 +1718,14 @@ def main():
     
     # Get usernames to analyze
     usernames = args.usernames
+    n_users = len(usernames)
     num_games = args.num_games
     delay = args.delay
     
-    if len(usernames) == 1:
+    if n_users == 1:
         print(f"\n🚀 Starting analysis for {usernames[0]} ({num_games} games)...")
     else:
-        print(f"\n🚀 Starting batch analysis for {len(usernames)} users ({num_games} games each)...")
+        print(f"\n🚀 Starting batch analysis for {n_users} users ({num_games} games each)...")
         print(f"👥 Users: {', '.join(usernames)}")
         print(f"⏱️  Delay between users: {delay} seconds")
     
@@ -974,33 +1739,79 @@ def main():
     
     print(f"�📊 Database storage: {'Enabled' if save_to_db else 'Disabled'}")
     
-    # Process each username
-    for i, username in enumerate(usernames, 1):
-        if len(usernames) > 1:
-            print(f"\n{'='*60}")
-            print(f"🎯 Processing user {i}/{len(usernames)}: {username}")
-            print(f"{'='*60}")
-        
-        try:
-            analyze_user_games(
-                username, 
-                num_games=num_games, 
-                save_to_database=save_to_db,
-                start_date=start_datetime,
-                end_date=end_datetime
-            )
-        except Exception as e:
-            print(f"❌ Error analyzing {username}: {e}")
-            print("   Continuing with next user...")
-        
-        # Add delay between users (except for the last one)
-        if i < len(usernames) and delay > 0:
-            print(f"\n⏳ Waiting {delay} seconds before processing next user...")
-            import time
-            time.sleep(delay)
-    
-    if len(usernames) > 1:
-        print(f"\n🏁 Batch analysis complete! Processed {len(usernames)} users.")
+    # Concurrent batch mode: each user's analysis is dominated by HTTP
+    # waits, so a small thread pool turns sum(per_user) into roughly
+    # max(per_user). Submissions are staggered by --delay to stay under
+    # the API rate limit, and no database connection is shared across
+    # threads (pyodbc connections are not thread-safe), so each task
+    # opens its own when storage is enabled.
+    if args.workers > 1 and n_users > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        print(f"\n🧵 Analyzing {n_users} users with {args.workers} workers...")
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = []
+            for i, username in enumerate(usernames):
+                if i and delay > 0:
+                    time.sleep(delay)
+                futures.append((username, executor.submit(
+                    analyze_user_games,
+                    username,
+                    num_games=num_games,
+                    save_to_database=save_to_db,
+                    start_date=start_datetime,
+                    end_date=end_datetime
+                )))
+
+            for username, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error analyzing {username}: {e}")
+
+        print(f"\n🏁 Batch analysis complete! Processed {n_users} users.")
+        return
+
+    # Open one database connection for the whole batch instead of one
+    # TCP/TLS/Azure-AD handshake per user
+    shared_db_connection = None
+    if save_to_db:
+        shared_db_connection = get_database_connection()
+        if not shared_db_connection:
+            print("❌ Database connection failed, proceeding without database")
+
+    try:
+        # Process each username
+        for i, username in enumerate(usernames, 1):
+            if n_users > 1:
+                print(f"\n{'='*60}")
+                print(f"🎯 Processing user {i}/{n_users}: {username}")
+                print(f"{'='*60}")
+
+            try:
+                analyze_user_games(
+                    username,
+                    num_games=num_games,
+                    save_to_database=save_to_db,
+                    start_date=start_datetime,
+                    end_date=end_datetime,
+                    db_connection=shared_db_connection
+                )
+            except Exception as e:
+                print(f"❌ Error analyzing {username}: {e}")
+                print("   Continuing with next user...")
+
+            # Add delay between users (except for the last one)
+            if i < n_users and delay > 0:
+                print(f"\n⏳ Waiting {delay} seconds before processing next user...")
+                time.sleep(delay)
+    finally:
+        if shared_db_connection:
+            shared_db_connection.close()
+            print(f"\n✅ Database connection closed")
+    
+    if n_users > 1:
+        print(f"\n🏁 Batch analysis complete! Processed {n_users} users.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""
+Chess.com Parsed-Game Cache
+
+SQLite-backed cache of per-game analysis results, keyed by game URL and
+username: both players of a game share one URL, but every stored field
+(result, color, ratings) is from the analyzed player's point of view.
+Past games never change, so re-running the tool for the same user only
+pays the PGN-parsing cost for games it has not seen before; everything
+else is rebuilt from a single indexed lookup.
+
+The database lives under the same cache/ directory as the archive cache.
+"""
+
+import os
+import sqlite3
+
+CACHE_DB = os.path.join('cache', 'parsed_games.sqlite')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed (
+    url TEXT NOT NULL,
+    username TEXT NOT NULL,
+    game_id TEXT,
+    date TEXT,
+    end_time INTEGER,
+    player_color TEXT,
+    player_rating INTEGER,
+    opponent_username TEXT,
+    opponent_rating INTEGER,
+    result TEXT,
+    termination TEXT,
+    time_control TEXT,
+    time_control_bucket TEXT,
+    rated INTEGER,
+    rules TEXT,
+    opening_moves TEXT,
+    opening_name TEXT,
+    accuracy_white REAL,
+    accuracy_black REAL,
+    PRIMARY KEY (url, username)
+)
+"""
+
+# Columns stored per game, in insert order (pgn/url excluded: the PGN is
+# re-attached from the live archive data on cache hits)
+_COLUMNS = (
+    'game_id', 'date', 'end_time', 'player_color', 'player_rating',
+    'opponent_username', 'opponent_rating', 'result', 'termination',
+    'time_control', 'time_control_bucket', 'rated', 'rules',
+    'opening_moves', 'opening_name', 'accuracy_white', 'accuracy_black'
+)
+
+
+def connect():
+    """
+    Open (and create if needed) the parsed-game cache database.
+
+    Returns:
+        sqlite3.Connection: Connection with WAL journaling, or None if
+        the cache directory cannot be created
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_DB), exist_ok=True)
+        connection = sqlite3.connect(CACHE_DB)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(_SCHEMA)
+        return connection
+    except (OSError, sqlite3.Error):
+        # Caching is best-effort; analysis proceeds without it
+        return None
+
+
+def lookup(connection, username, url):
+    """
+    Fetch a previously parsed game by URL, as seen by one player.
+
+    Args:
+        connection: Connection from connect(), may be None
+        username (str): Chess.com username the analysis belongs to
+        url (str): Chess.com game URL
+
+    Returns:
+        dict: AnalyzedGame constructor kwargs (everything except 'pgn'),
+              or None on a cache miss
+    """
+    if not connection or not url:
+        return None
+    try:
+        row = connection.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM parsed WHERE url = ? AND username = ?",
+            (url, username.lower())
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+
+    analysis = dict(zip(_COLUMNS, row))
+    analysis['rated'] = bool(analysis['rated'])
+    analysis['url'] = url
+    return analysis
+
+
+def store(connection, username, analysis):
+    """
+    Store a parsed game, ignoring duplicates.
+
+    Args:
+        connection: Connection from connect(), may be None
+        username (str): Chess.com username the analysis belongs to
+        analysis (AnalyzedGame): Analyzed game record
+    """
+    if not connection or not analysis.url:
+        return
+    try:
+        connection.execute(
+            f"INSERT OR IGNORE INTO parsed (url, username, {', '.join(_COLUMNS)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(_COLUMNS))})",
+            (analysis.url, username.lower()) + tuple(
+                int(getattr(analysis, column)) if column == 'rated'
+                else getattr(analysis, column) for column in _COLUMNS
+            )
+        )
+    except sqlite3.Error:
+        pass
+
+
+def close(connection):
+    """Commit and close the cache connection, if open."""
+    if connection:
+        try:
+            connection.commit()
+            connection.close()
+        except sqlite3.Error:
+            pass
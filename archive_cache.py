@@ -0,0 +1,154 @@
+"""
+Chess.com Monthly Archive Cache
+
+Persistent on-disk cache for Chess.com monthly game archives, keyed by
+(username, year, month). Chess.com archives for past months rarely change,
+so cached entries are revalidated with conditional requests
+(If-Modified-Since / If-None-Match) and closed months are treated as
+immutable after a grace period, skipping the network entirely.
+
+Cache layout:
+    cache/{username}/{year}-{month:02d}.json.gz
+
+Each entry stores the games list plus the server's Last-Modified / ETag
+headers and the fetch timestamp.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+
+# Try to use orjson for faster (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Root directory for cached archives (relative to the working directory)
+CACHE_DIR = 'cache'
+
+# Closed months are treated as immutable once the cache entry is older
+# than this grace period, so not even a conditional request is sent.
+IMMUTABLE_GRACE_DAYS = 7
+
+
+def _cache_path(username, year, month):
+    """Build the cache file path for a (username, year, month) key."""
+    return os.path.join(CACHE_DIR, username.lower(), f"{year}-{month:02d}.json.gz")
+
+
+def _dumps(obj):
+    """Serialize a cache entry to bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data):
+    """Deserialize a cache entry from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(username, year, month):
+    """
+    Load a cached monthly archive if present.
+
+    Args:
+        username (str): Chess.com username
+        year (int): Archive year
+        month (int): Archive month
+
+    Returns:
+        dict: Cache entry with 'games', 'last_modified', 'etag',
+              'fetched_at' keys, or None if not cached / unreadable
+    """
+    path = _cache_path(username, year, month)
+    try:
+        with gzip.open(path, 'rb') as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def store(username, year, month, games, last_modified=None, etag=None):
+    """
+    Store a monthly archive in the cache.
+
+    Args:
+        username (str): Chess.com username
+        year (int): Archive year
+        month (int): Archive month
+        games (list): Games list from the archive response
+        last_modified (str): Last-Modified header from the server, if any
+        etag (str): ETag header from the server, if any
+    """
+    path = _cache_path(username, year, month)
+    entry = {
+        'games': games,
+        'last_modified': last_modified,
+        'etag': etag,
+        'fetched_at': datetime.now().timestamp()
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, 'wb') as f:
+            f.write(_dumps(entry))
+    except OSError:
+        # Caching is best-effort; never fail the analysis over a cache write
+        pass
+
+
+def is_immutable(entry, year, month):
+    """
+    Check whether a cached entry can be served without any network request.
+
+    A month is considered closed once the current date has moved past it;
+    closed months are immutable after a grace period (Chess.com may still
+    backfill accuracy data shortly after a month ends).
+
+    Args:
+        entry (dict): Cache entry from load()
+        year (int): Archive year
+        month (int): Archive month
+
+    Returns:
+        bool: True if the entry can be used without revalidation
+    """
+    if not entry:
+        return False
+
+    now = datetime.now()
+    if (year, month) >= (now.year, now.month):
+        # Current or future month: always revalidate
+        return False
+
+    # End of the archived month = start of the following month
+    if month == 12:
+        month_end = datetime(year + 1, 1, 1)
+    else:
+        month_end = datetime(year, month + 1, 1)
+
+    return (now - month_end).days >= IMMUTABLE_GRACE_DAYS
+
+
+def conditional_headers(entry):
+    """
+    Build conditional request headers from a cached entry.
+
+    Args:
+        entry (dict): Cache entry from load(), or None
+
+    Returns:
+        dict: Headers with If-Modified-Since / If-None-Match as available
+    """
+    headers = {}
+    if entry:
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+    return headers
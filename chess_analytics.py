@@ -11,15 +11,112 @@ Chess.com API Documentation: https://www.chess.com/news/view/published-data-api
 Python Client: https://pypi.org/project/chess.com/
 """
 
-import json
+import functools
+import time
 from datetime import datetime, timedelta
 from chessdotcom import get_player_profile, get_player_stats, get_player_games_by_month, get_player_clubs
 from chessdotcom import get_leaderboards, get_country_details, get_club_details
 from chessdotcom.client import Client
 
+# The error type moved between chessdotcom releases
+try:
+    from chessdotcom.types import ChessDotComError
+except ImportError:
+    from chessdotcom import ChessDotComError
+
 # Configure the client with a proper User-Agent header
 Client.request_config['headers']['User-Agent'] = 'Chess.com Analytics Tool. Contact: your-email@example.com'
 
+# Ask for compressed responses; PGN-heavy archive months shrink ~5x on
+# the wire and the HTTP library decompresses transparently
+Client.request_config['headers']['Accept-Encoding'] = 'gzip, deflate'
+
+
+def _with_retries(request_func, max_tries=3):
+    """
+    Retry a chessdotcom request on rate limits instead of failing the run.
+
+    A 429 sleeps for the server's Retry-After (doubling the wait on each
+    repeat) and tries again, up to max_tries attempts total; anything
+    else propagates immediately.
+
+    Args:
+        request_func: The client request function to wrap
+        max_tries (int): Total attempts before re-raising
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    @functools.wraps(request_func)
+    def wrapper(*args, **kwargs):
+        delay = 2
+        for attempt in range(max_tries):
+            try:
+                return request_func(*args, **kwargs)
+            except Exception as err:
+                if getattr(err, 'status_code', None) != 429 or attempt == max_tries - 1:
+                    raise
+                headers = getattr(err, 'headers', None) or {}
+                try:
+                    wait = float(headers.get('Retry-After', delay))
+                except (TypeError, ValueError):
+                    wait = delay
+                time.sleep(wait)
+                delay *= 2
+    return wrapper
+
+
+# Patch the client's request entry point so every call (profile, stats,
+# games, leaderboards) gets the retry behavior. The attribute name is
+# version-dependent, hence the guard.
+if hasattr(Client, 'do_get_request'):
+    Client.do_get_request = _with_retries(Client.do_get_request)
+
+# Profiles and stats change on the order of minutes, so repeated lookups
+# for the same username within this window reuse the previous response.
+PLAYER_CACHE_TTL_SECONDS = 300
+
+_profile_cache = {}
+_stats_cache = {}
+
+
+def cached_profile(username):
+    """
+    Fetch a player profile, reusing a recent response for the same user.
+
+    Args:
+        username (str): Chess.com username
+
+    Returns:
+        Response object from get_player_profile
+    """
+    key = username.lower()
+    cached = _profile_cache.get(key)
+    if cached and time.time() - cached[0] < PLAYER_CACHE_TTL_SECONDS:
+        return cached[1]
+    response = get_player_profile(username)
+    _profile_cache[key] = (time.time(), response)
+    return response
+
+
+def cached_stats(username):
+    """
+    Fetch player stats, reusing a recent response for the same user.
+
+    Args:
+        username (str): Chess.com username
+
+    Returns:
+        Response object from get_player_stats
+    """
+    key = username.lower()
+    cached = _stats_cache.get(key)
+    if cached and time.time() - cached[0] < PLAYER_CACHE_TTL_SECONDS:
+        return cached[1]
+    response = get_player_stats(username)
+    _stats_cache[key] = (time.time(), response)
+    return response
+
 
 def display_player_info(username):
     """
@@ -32,20 +129,26 @@ def display_player_info(username):
         print(f"\n=== Player Profile: {username} ===")
         
         # Get player profile
-        profile = get_player_profile(username)
+        profile = cached_profile(username)
         player_data = profile.json['player']
         
+        # Pull each timestamp once instead of re-reading the dict inside
+        # the f-string ternaries
+        country = player_data.get('country')
+        joined = player_data.get('joined')
+        last_online = player_data.get('last_online')
+
         print(f"Name: {player_data.get('name', 'N/A')}")
         print(f"Title: {player_data.get('title', 'None')}")
         print(f"Followers: {player_data.get('followers', 0)}")
-        print(f"Country: {player_data.get('country', 'N/A').split('/')[-1] if player_data.get('country') else 'N/A'}")
+        print(f"Country: {country.split('/')[-1] if country else 'N/A'}")
         print(f"Location: {player_data.get('location', 'N/A')}")
-        print(f"Joined: {datetime.fromtimestamp(player_data.get('joined', 0)).strftime('%Y-%m-%d') if player_data.get('joined') else 'N/A'}")
-        print(f"Last Online: {datetime.fromtimestamp(player_data.get('last_online', 0)).strftime('%Y-%m-%d %H:%M') if player_data.get('last_online') else 'N/A'}")
+        print(f"Joined: {datetime.fromtimestamp(joined).strftime('%Y-%m-%d') if joined else 'N/A'}")
+        print(f"Last Online: {datetime.fromtimestamp(last_online).strftime('%Y-%m-%d %H:%M') if last_online else 'N/A'}")
         
         return True
         
-    except Exception as e:
+    except ChessDotComError as e:
         print(f"Error fetching player profile: {e}")
         return False
 
@@ -61,7 +164,7 @@ def display_player_stats(username):
         print(f"\n=== Player Stats: {username} ===")
         
         # Get player stats
-        stats = get_player_stats(username)
+        stats = cached_stats(username)
         stats_data = stats.json
         
         # Display different game mode stats
@@ -73,10 +176,12 @@ def display_player_stats(username):
                 last_rating = mode_data.get('last', {})
                 best_rating = mode_data.get('best', {})
                 
+                best_date = best_rating.get('date')
+
                 print(f"\n{mode.replace('chess_', '').title()}:")
                 print(f"  Current Rating: {last_rating.get('rating', 'N/A')}")
                 print(f"  Games Played: {last_rating.get('rd', 'N/A')}")
-                print(f"  Best Rating: {best_rating.get('rating', 'N/A')} on {datetime.fromtimestamp(best_rating.get('date', 0)).strftime('%Y-%m-%d') if best_rating.get('date') else 'N/A'}")
+                print(f"  Best Rating: {best_rating.get('rating', 'N/A')} on {datetime.fromtimestamp(best_date).strftime('%Y-%m-%d') if best_date else 'N/A'}")
         
         # Display puzzle stats if available
         if 'puzzle_rush' in stats_data:
@@ -88,7 +193,7 @@ def display_player_stats(username):
         
         return True
         
-    except Exception as e:
+    except ChessDotComError as e:
         print(f"Error fetching player stats: {e}")
         return False
 
@@ -135,11 +240,31 @@ def get_recent_games(username, year=None, month=None):
         
         return games_data
         
-    except Exception as e:
+    except ChessDotComError as e:
         print(f"Error fetching recent games: {e}")
         return []
 
 
+# Chess.com API result codes mapped to game outcomes; one dict lookup
+# per game instead of rebuilding and scanning membership lists
+_RESULT_MAP = {
+    'win': 'Win',
+    'checkmated': 'Loss',
+    'resigned': 'Loss',
+    'timeout': 'Loss',
+    'abandoned': 'Loss',
+    'kingofthehill': 'Loss',
+    'threecheck': 'Loss',
+    'bughousepartnerlose': 'Loss',
+    'agreed': 'Draw',
+    'repetition': 'Draw',
+    'stalemate': 'Draw',
+    'insufficient': 'Draw',
+    '50move': 'Draw',
+    'timevsinsufficient': 'Draw',
+}
+
+
 def analyze_game_performance(games_data, username):
     """
     Analyze game performance from games data
@@ -157,21 +282,22 @@ def analyze_game_performance(games_data, username):
     wins = 0
     losses = 0
     draws = 0
-    
+    username_lower = username.lower()
+
     for game in games_data:
-        white_player = game['white']['username'].lower()
-        black_player = game['black']['username'].lower()
-        
-        if username.lower() == white_player:
-            result = game['white'].get('result', '')
-        elif username.lower() == black_player:
+        # Check white first and only lowercase black's name when needed
+        white = game['white']
+        if white['username'].lower() == username_lower:
+            result = white.get('result', '')
+        elif game['black']['username'].lower() == username_lower:
             result = game['black'].get('result', '')
         else:
             continue
             
-        if result == 'win':
+        outcome = _RESULT_MAP.get(result, 'Draw')
+        if outcome == 'Win':
             wins += 1
-        elif result in ['checkmated', 'resigned', 'timeout', 'abandoned']:
+        elif outcome == 'Loss':
             losses += 1
         else:
             draws += 1
@@ -206,7 +332,7 @@ def explore_leaderboards():
                     rating = player.get('score', 'N/A')
                     print(f"  {i}. {username}: {rating}")
         
-    except Exception as e:
+    except ChessDotComError as e:
         print(f"Error fetching leaderboards: {e}")
 
 
@@ -5,177 +5,336 @@ This script analyzes the last 50 games from a Chess.com user profile,
 focusing on win/loss records, opening moves, ratings, and game accuracy.
 """
 
-import json
-from datetime import datetime, timedelta
-from chessdotcom import get_player_profile, get_player_games_by_month
+import functools
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Semaphore
+from chessdotcom import get_player_profile, get_player_games_by_month, get_player_game_archives
 from chessdotcom.client import Client
-import re
+
+# The error type moved between chessdotcom releases
+try:
+    from chessdotcom.types import ChessDotComError
+except ImportError:
+    from chessdotcom import ChessDotComError
+
+import archive_cache
 
 # IMPORTANT: Set a proper User-Agent header (required by Chess.com API)
 Client.request_config['headers']['User-Agent'] = 'Chess.com Game Analysis Tool. Contact: your-email@example.com'
 
+# Ask for compressed responses; PGN-heavy archive months shrink ~5x on
+# the wire and the HTTP library decompresses transparently
+Client.request_config['headers']['Accept-Encoding'] = 'gzip, deflate'
+
+
+def _with_retries(request_func, max_tries=3):
+    """
+    Retry a chessdotcom request on rate limits instead of failing the run.
+
+    A 429 sleeps for the server's Retry-After (doubling the wait on each
+    repeat) and tries again, up to max_tries attempts total; anything
+    else propagates immediately.
+
+    Args:
+        request_func: The client request function to wrap
+        max_tries (int): Total attempts before re-raising
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    @functools.wraps(request_func)
+    def wrapper(*args, **kwargs):
+        delay = 2
+        for attempt in range(max_tries):
+            try:
+                return request_func(*args, **kwargs)
+            except Exception as err:
+                if getattr(err, 'status_code', None) != 429 or attempt == max_tries - 1:
+                    raise
+                headers = getattr(err, 'headers', None) or {}
+                try:
+                    wait = float(headers.get('Retry-After', delay))
+                except (TypeError, ValueError):
+                    wait = delay
+                time.sleep(wait)
+                delay *= 2
+    return wrapper
+
+
+# Patch the client's request entry point so every call (profile, stats,
+# monthly archives) gets the retry behavior. The attribute name is
+# version-dependent, hence the guard.
+if hasattr(Client, 'do_get_request'):
+    Client.do_get_request = _with_retries(Client.do_get_request)
+
+# The current month's archive grows as the player finishes games, so a
+# cached copy is only reused for this long before refetching.
+CURRENT_MONTH_TTL_SECONDS = 60
+
+
+def cached_month(username, year, month):
+    """
+    Fetch a monthly archive, serving closed months from the disk cache.
+
+    Archives for months that have already ended are immutable on
+    Chess.com, so cached copies are returned without touching the
+    network. The current month is refetched once its cached copy is
+    older than CURRENT_MONTH_TTL_SECONDS.
+
+    Args:
+        username (str): Chess.com username
+        year (int): Archive year
+        month (int): Archive month
 
+    Returns:
+        list: List of game dictionaries for the month
+    """
+    entry = archive_cache.load(username, year, month)
+    if archive_cache.is_immutable(entry, year, month):
+        return entry['games']
+    if entry and time.time() - entry.get('fetched_at', 0) < CURRENT_MONTH_TTL_SECONDS:
+        return entry['games']
+
+    try:
+        monthly_games = get_player_games_by_month(username, year, month)
+    except Exception:
+        # Fall back to a stale cached copy rather than dropping the month
+        if entry:
+            return entry['games']
+        raise
+    games = monthly_games.json.get('games', [])
+    archive_cache.store(username, year, month, games)
+    return games
+
+
+# Only the headers and the first few moves of each PGN are ever read
+# (extract_first_three_moves, debug samples), so the rest is dropped at
+# fetch time. 2 KB comfortably covers Chess.com's header block plus six
+# clock-annotated half-moves.
+PGN_KEEP_CHARS = 2048
+
+# Chess.com's rate limiting counts simultaneous requests, so keep at
+# most three archive fetches in flight at a time.
+_FETCH_SEMAPHORE = Semaphore(3)
+
+
+def _fetch_month_limited(username, year, month):
+    """Fetch one month through cached_month under the shared semaphore."""
+    with _FETCH_SEMAPHORE:
+        return cached_month(username, year, month)
+
+
+@functools.lru_cache(maxsize=32)
 def get_last_50_games(username):
     """
-    Fetch the last 50 games for a given username by searching recent months.
-    
+    Fetch the last 50 games for a given username.
+
+    Asks the archives endpoint which months actually contain games and
+    fetches those from the newest backwards, so an active player costs
+    one or two requests and months without games cost none.
+
+    Results are memoized per process (main analyzes and then compares
+    the same player), so callers must treat the returned list as
+    read-only.
+
     Args:
         username (str): Chess.com username
-        
+
     Returns:
-        list: List of game dictionaries
+        list: List of game dictionaries, oldest first
     """
-    games = []
-    current_date = datetime.now()
-    
-    # Search through the last 6 months to get 50 games
-    for month_offset in range(6):
-        target_date = current_date - timedelta(days=30 * month_offset)
-        year = target_date.year
-        month = target_date.month
-        
-        try:
-            monthly_games = get_player_games_by_month(username, year, month)
-            monthly_data = monthly_games.json.get('games', [])
-            games.extend(monthly_data)
-            
+    # Archive URLs end in /YYYY/MM and are listed oldest first; only the
+    # newest six months are ever needed for 50 games
+    try:
+        archives = get_player_game_archives(username).json.get('archives', [])
+    except ChessDotComError as e:
+        print(f"Error fetching archive list for {username}: {e}")
+        return []
+
+    months = []
+    for url in reversed(archives[-6:]):
+        year, month = url.rstrip('/').split('/')[-2:]
+        months.append((int(year), int(month)))
+
+    if not months:
+        return []
+
+    # Fetch the months concurrently (bounded by the semaphore), but
+    # consume the results newest first so the early stop still works
+    monthly_lists = []
+    total = 0
+    with ThreadPoolExecutor(max_workers=len(months)) as executor:
+        futures = [executor.submit(_fetch_month_limited, username, year, month)
+                   for year, month in months]
+        for (year, month), future in zip(months, futures):
+            try:
+                monthly_data = future.result()
+            except ChessDotComError as e:
+                print(f"Error fetching games for {year}-{month:02d}: {e}")
+                continue
+            monthly_lists.append(monthly_data)
+            total += len(monthly_data)
+
             print(f"Found {len(monthly_data)} games in {year}-{month:02d}")
-            
+
             # Stop if we have enough games
-            if len(games) >= 50:
+            if total >= 50:
                 break
-                
-        except Exception as e:
-            print(f"Error fetching games for {year}-{month:02d}: {e}")
-            continue
-    
+
+    # Months arrived newest first; extend oldest first into a bounded
+    # deque so older games fall off the left and only the 50 most recent
+    # are ever held, however busy the months were
+    games = deque(maxlen=50)
+    for monthly_data in reversed(monthly_lists):
+        games.extend(monthly_data)
+
+    # Truncate the PGN of the games actually kept; a full game record
+    # can carry 2-5 KB of movetext nothing downstream looks at. The disk
+    # cache keeps complete PGNs (it is shared with the advanced script).
+    for game in games:
+        pgn = game.get('pgn')
+        if pgn is not None and len(pgn) > PGN_KEEP_CHARS:
+            game['pgn'] = pgn[:PGN_KEEP_CHARS]
+
     # Return the most recent 50 games
-    return games[-50:] if len(games) >= 50 else games
+    return list(games)
 
 
 def extract_first_three_moves(pgn):
     """
-    Extract the first 3 moves from a PGN string.
-    
+    Extract the first 3 moves (6 half-moves) from a PGN string.
+
+    Walks the movetext once, skipping move numbers, brace comments and
+    the game result token, instead of regex-matching the whole PGN.
+
     Args:
         pgn (str): PGN notation of the game
-        
+
     Returns:
         str: First 3 moves in algebraic notation
     """
     if not pgn:
         return "N/A"
-    
-    try:
-        # Find the moves section (after headers)
-        moves_section = pgn
-        if '[White ' in pgn:
-            # Split by newlines and find where moves start
-            lines = pgn.split('\n')
-            moves_lines = []
-            in_moves = False
-            for line in lines:
-                if line.strip() and not line.startswith('['):
-                    in_moves = True
-                if in_moves and line.strip():
-                    moves_lines.append(line.strip())
-            moves_section = ' '.join(moves_lines)
-        
-        # Extract moves using regex pattern for standard notation
-        # Pattern matches: 1. e4 e5 2. Nf3 Nc6 etc.
-        move_pattern = r'(\d+)\.\s*([^\s]+)(?:\s+([^\s]+))?'
-        moves = re.findall(move_pattern, moves_section)
-        
-        if moves:
-            first_three = []
-            for i in range(min(3, len(moves))):
-                move_num, white_move, black_move = moves[i]
-                if white_move:
-                    move_str = f"{move_num}.{white_move}"
-                    if black_move and not black_move.startswith('{'):
-                        move_str += f" {black_move}"
-                    first_three.append(move_str)
-            return " ".join(first_three)
-        
-        # Fallback: try to extract any chess moves
-        chess_moves = re.findall(r'\b[NBRQK]?[a-h]?[1-8]?x?[a-h][1-8](?:=[NBRQ])?[+#]?|\bO-O(?:-O)?[+#]?', moves_section)
-        if chess_moves:
-            return " ".join(chess_moves[:6])  # First 6 half-moves = 3 full moves
-        
-        return "N/A"
-            
-    except Exception as e:
-        return "N/A"
 
+    # Movetext starts after the blank line that closes the header section
+    header_end = pgn.find('\n\n')
+    movetext = pgn[header_end + 2:] if header_end != -1 else pgn
+
+    moves = []
+    comment_depth = 0
+    for token in movetext.split():
+        if comment_depth > 0 or token.startswith('{'):
+            # Inside a {...} comment (clock annotations etc.), which may
+            # span several whitespace-separated tokens
+            comment_depth = max(0, comment_depth + token.count('{') - token.count('}'))
+            continue
+        if token.endswith('.') or token in ('1-0', '0-1', '1/2-1/2', '*'):
+            # Move number ("1.", "1...") or game result
+            continue
+        moves.append(token)
+        if len(moves) == 6:
+            break
+
+    return " ".join(moves) if moves else "N/A"
+
+
+# Chess.com API result codes mapped to game outcomes; one dict lookup
+# per game instead of rebuilding and scanning membership lists
+_RESULT_MAP = {
+    'win': 'Win',
+    'checkmated': 'Loss',
+    'resigned': 'Loss',
+    'timeout': 'Loss',
+    'abandoned': 'Loss',
+    'kingofthehill': 'Loss',
+    'threecheck': 'Loss',
+    'bughousepartnerlose': 'Loss',
+    'agreed': 'Draw',
+    'repetition': 'Draw',
+    'stalemate': 'Draw',
+    'insufficient': 'Draw',
+    '50move': 'Draw',
+    'timevsinsufficient': 'Draw',
+}
+
+
+def game_summary(game, username_lower):
+    """
+    Summarize one game for a user in a single pass.
+
+    Fuses the work previously split across analyze_game_result and
+    extract_accuracy, so the color lookup and username comparison
+    happen once per game instead of twice.
+
+    Args:
+        game (dict): Game data from Chess.com API
+        username_lower (str): Lowercased username to analyze
+
+    Returns:
+        tuple: (result, user_color, user_rating, opponent_rating,
+                opponent_name, accuracy)
+    """
+    white = game['white']
+    black = game['black']
+    if white['username'].lower() == username_lower:
+        side, opponent, user_color = white, black, "white"
+    elif black['username'].lower() == username_lower:
+        side, opponent, user_color = black, white, "black"
+    else:
+        return "unknown", "unknown", "N/A", "N/A", "N/A", None
+
+    # Convert result to win/loss/draw
+    result = _RESULT_MAP.get(side.get('result', ''), "Unknown")
+
+    accuracy = side.get('accuracy')
+    if accuracy is not None:
+        try:
+            accuracy = float(accuracy)
+        except (TypeError, ValueError):
+            accuracy = None
 
-def analyze_game_result(game, username):
+    return (result, user_color, side.get('rating', 'N/A'),
+            opponent.get('rating', 'N/A'), opponent['username'], accuracy)
+
+
+def analyze_game_result(game, username, username_lower=None):
     """
     Determine if the user won, lost, or drew the game.
-    
+
     Args:
         game (dict): Game data from Chess.com API
         username (str): Username to analyze
-        
+        username_lower (str): Pre-lowercased username, so per-game loops
+            don't re-lowercase on every call
+
     Returns:
         tuple: (result, user_color, user_rating, opponent_rating, opponent_name)
     """
-    white_player = game['white']['username'].lower()
-    black_player = game['black']['username'].lower()
-    username_lower = username.lower()
-    
-    if username_lower == white_player:
-        user_color = "white"
-        user_result = game['white'].get('result', 'unknown')
-        user_rating = game['white'].get('rating', 'N/A')
-        opponent_rating = game['black'].get('rating', 'N/A')
-        opponent_name = game['black']['username']
-    elif username_lower == black_player:
-        user_color = "black"
-        user_result = game['black'].get('result', 'unknown')
-        user_rating = game['black'].get('rating', 'N/A')
-        opponent_rating = game['white'].get('rating', 'N/A')
-        opponent_name = game['white']['username']
-    else:
-        return "unknown", "unknown", "N/A", "N/A", "N/A"
-    
-    # Convert result to win/loss/draw
-    if user_result == "win":
-        result = "Win"
-    elif user_result in ["checkmated", "resigned", "timeout", "abandoned"]:
-        result = "Loss"
-    elif user_result in ["agreed", "repetition", "stalemate", "insufficient"]:
-        result = "Draw"
-    else:
-        result = "Unknown"
-    
-    return result, user_color, user_rating, opponent_rating, opponent_name
+    if username_lower is None:
+        username_lower = username.lower()
+    return game_summary(game, username_lower)[:5]
 
 
-def extract_accuracy(game, username):
+def extract_accuracy(game, username, username_lower=None):
     """
     Extract game accuracy if available.
-    
+
     Args:
         game (dict): Game data from Chess.com API
         username (str): Username to analyze
-        
+        username_lower (str): Pre-lowercased username, so per-game loops
+            don't re-lowercase on every call
+
     Returns:
-        str: Accuracy percentage or "N/A"
+        float: Accuracy percentage, or None if unavailable
     """
-    white_player = game['white']['username'].lower()
-    username_lower = username.lower()
-    
-    try:
-        if username_lower == white_player:
-            accuracy = game['white'].get('accuracy', 'N/A')
-        else:
-            accuracy = game['black'].get('accuracy', 'N/A')
-        
-        if accuracy and accuracy != 'N/A':
-            return f"{accuracy}%"
-        return "N/A"
-    except:
-        return "N/A"
+    if username_lower is None:
+        username_lower = username.lower()
+    return game_summary(game, username_lower)[5]
 
 
 def analyze_games(username):
@@ -204,16 +363,16 @@ def analyze_games(username):
     draws = 0
     total_accuracy = 0
     accuracy_count = 0
-    time_controls = {}
-    opening_moves = {}
-    
+    time_controls = Counter()
+    opening_moves = Counter()
+    username_lower = username.lower()
+
     # Detailed game analysis
     print(f"\n{'Game':<4} {'Result':<6} {'Color':<6} {'User Rating':<12} {'Opp Rating':<11} {'Accuracy':<9} {'Opening':<20} {'Time Control'}")
     print("-" * 100)
-    
+
     for i, game in enumerate(games[-50:], 1):  # Last 50 games
-        result, color, user_rating, opp_rating, opponent = analyze_game_result(game, username)
-        accuracy = extract_accuracy(game, username)
+        result, color, user_rating, opp_rating, opponent, accuracy = game_summary(game, username_lower)
         first_moves = extract_first_three_moves(game.get('pgn', ''))
         time_control = game.get('time_control', 'N/A')
         
@@ -225,24 +384,21 @@ def analyze_games(username):
         elif result == "Draw":
             draws += 1
         
-        # Track accuracy
-        if accuracy != "N/A":
-            try:
-                acc_value = float(accuracy.replace('%', ''))
-                total_accuracy += acc_value
-                accuracy_count += 1
-            except:
-                pass
-        
+        # Track accuracy (kept numeric; formatted only for display)
+        if accuracy is not None:
+            total_accuracy += accuracy
+            accuracy_count += 1
+
         # Track time controls
-        time_controls[time_control] = time_controls.get(time_control, 0) + 1
-        
+        time_controls[time_control] += 1
+
         # Track opening moves
         if first_moves != "N/A":
-            opening_moves[first_moves] = opening_moves.get(first_moves, 0) + 1
-        
+            opening_moves[first_moves] += 1
+
         # Display game info
-        print(f"{i:<4} {result:<6} {color:<6} {user_rating:<12} {opp_rating:<11} {accuracy:<9} {first_moves[:20]:<20} {time_control}")
+        accuracy_str = f"{accuracy:.1f}%" if accuracy is not None else "N/A"
+        print(f"{i:<4} {result:<6} {color:<6} {user_rating:<12} {opp_rating:<11} {accuracy_str:<9} {first_moves[:20]:<20} {time_control}")
     
     # Summary statistics
     total_games = wins + losses + draws
@@ -266,14 +422,12 @@ def analyze_games(username):
     
     # Most common time controls
     print(f"\nMost Common Time Controls:")
-    sorted_time_controls = sorted(time_controls.items(), key=lambda x: x[1], reverse=True)
-    for tc, count in sorted_time_controls[:5]:
+    for tc, count in time_controls.most_common(5):
         print(f"  {tc}: {count} games")
-    
+
     # Most common openings
     print(f"\nMost Common Opening Sequences:")
-    sorted_openings = sorted(opening_moves.items(), key=lambda x: x[1], reverse=True)
-    for opening, count in sorted_openings[:5]:
+    for opening, count in opening_moves.most_common(5):
         print(f"  {opening}: {count} times")
 
 
@@ -297,10 +451,10 @@ def compare_players(usernames):
         
         wins = losses = draws = 0
         total_accuracy = accuracy_count = 0
-        
+        username_lower = username.lower()
+
         for game in games[-50:]:
-            result, _, _, _, _ = analyze_game_result(game, username)
-            accuracy = extract_accuracy(game, username)
+            result, _, _, _, _, accuracy = game_summary(game, username_lower)
             
             if result == "Win":
                 wins += 1
@@ -309,14 +463,10 @@ def compare_players(usernames):
             elif result == "Draw":
                 draws += 1
             
-            if accuracy != "N/A":
-                try:
-                    acc_value = float(accuracy.replace('%', ''))
-                    total_accuracy += acc_value
-                    accuracy_count += 1
-                except:
-                    pass
-        
+            if accuracy is not None:
+                total_accuracy += accuracy
+                accuracy_count += 1
+
         total_games = wins + losses + draws
         if total_games > 0:
             win_rate = (wins / total_games) * 100
@@ -368,23 +518,26 @@ def analyze_games_simplified(username, num_games=50):
     
     # Limit to requested number of games
     recent_games = games[-num_games:] if len(games) >= num_games else games
-    
-    print(f"\nAnalyzing {len(recent_games)} games...")
-    print("-" * 80)
-    
+
+    # The report is accumulated in `rows` and written in one go at the
+    # end instead of one print (and potential flush) per game
+    rows = []
+    rows.append(f"\nAnalyzing {len(recent_games)} games...")
+    rows.append("-" * 80)
+
     # Initialize counters
     wins = losses = draws = 0
     total_accuracy = accuracy_count = 0
-    time_controls = {}
+    time_controls = Counter()
     rating_history = []
-    
+    username_lower = username.lower()
+
     # Detailed game analysis
-    print(f"{'#':<3} {'Result':<6} {'Color':<6} {'User Rating':<11} {'Opp Rating':<11} {'Accuracy':<9} {'Time Control':<12} {'Date':<10}")
-    print("-" * 90)
-    
+    rows.append(f"{'#':<3} {'Result':<6} {'Color':<6} {'User Rating':<11} {'Opp Rating':<11} {'Accuracy':<9} {'Time Control':<12} {'Date':<10}")
+    rows.append("-" * 90)
+
     for i, game in enumerate(recent_games, 1):
-        result, color, user_rating, opp_rating, opponent = analyze_game_result(game, username)
-        accuracy = extract_accuracy(game, username)
+        result, color, user_rating, opp_rating, opponent, accuracy = game_summary(game, username_lower)
         time_control = game.get('time_control', 'N/A')
         
         # Extract date from game URL or end_time
@@ -403,18 +556,14 @@ def analyze_games_simplified(username, num_games=50):
         elif result == "Draw":
             draws += 1
         
-        # Track accuracy
-        if accuracy != "N/A":
-            try:
-                acc_value = float(accuracy.replace('%', ''))
-                total_accuracy += acc_value
-                accuracy_count += 1
-            except:
-                pass
-        
+        # Track accuracy (kept numeric; formatted only for display)
+        if accuracy is not None:
+            total_accuracy += accuracy
+            accuracy_count += 1
+
         # Track time controls
-        time_controls[time_control] = time_controls.get(time_control, 0) + 1
-        
+        time_controls[time_control] += 1
+
         # Track rating history
         if user_rating != "N/A":
             try:
@@ -423,49 +572,52 @@ def analyze_games_simplified(username, num_games=50):
                 pass
         
         # Display game info
-        print(f"{i:<3} {result:<6} {color:<6} {user_rating:<11} {opp_rating:<11} {accuracy:<9} {time_control:<12} {game_date:<10}")
-    
+        accuracy_str = f"{accuracy:.1f}%" if accuracy is not None else "N/A"
+        rows.append(f"{i:<3} {result:<6} {color:<6} {user_rating:<11} {opp_rating:<11} {accuracy_str:<9} {time_control:<12} {game_date:<10}")
+
     # Summary statistics
     total_games = wins + losses + draws
-    print("\n" + "=" * 80)
-    print("SUMMARY STATISTICS")
-    print("=" * 80)
-    
+    rows.append("\n" + "=" * 80)
+    rows.append("SUMMARY STATISTICS")
+    rows.append("=" * 80)
+
     if total_games > 0:
         win_rate = (wins / total_games) * 100
         loss_rate = (losses / total_games) * 100
         draw_rate = (draws / total_games) * 100
-        
-        print(f"Total Games Analyzed: {total_games}")
-        print(f"Wins: {wins} ({win_rate:.1f}%)")
-        print(f"Losses: {losses} ({loss_rate:.1f}%)")
-        print(f"Draws: {draws} ({draw_rate:.1f}%)")
-        
+
+        rows.append(f"Total Games Analyzed: {total_games}")
+        rows.append(f"Wins: {wins} ({win_rate:.1f}%)")
+        rows.append(f"Losses: {losses} ({loss_rate:.1f}%)")
+        rows.append(f"Draws: {draws} ({draw_rate:.1f}%)")
+
         if accuracy_count > 0:
             avg_accuracy = total_accuracy / accuracy_count
-            print(f"Average Accuracy: {avg_accuracy:.1f}% (from {accuracy_count} games with accuracy data)")
+            rows.append(f"Average Accuracy: {avg_accuracy:.1f}% (from {accuracy_count} games with accuracy data)")
         else:
-            print("No accuracy data available")
-        
+            rows.append("No accuracy data available")
+
         # Rating statistics
         if rating_history:
             current_rating = rating_history[-1] if rating_history else "N/A"
             highest_rating = max(rating_history)
             lowest_rating = min(rating_history)
             avg_rating = sum(rating_history) / len(rating_history)
-            
-            print(f"Rating Statistics:")
-            print(f"  Current: {current_rating}")
-            print(f"  Highest: {highest_rating}")
-            print(f"  Lowest: {lowest_rating}")
-            print(f"  Average: {avg_rating:.0f}")
-    
+
+            rows.append(f"Rating Statistics:")
+            rows.append(f"  Current: {current_rating}")
+            rows.append(f"  Highest: {highest_rating}")
+            rows.append(f"  Lowest: {lowest_rating}")
+            rows.append(f"  Average: {avg_rating:.0f}")
+
     # Most common time controls
-    print(f"\nTime Control Distribution:")
-    sorted_time_controls = sorted(time_controls.items(), key=lambda x: x[1], reverse=True)
-    for tc, count in sorted_time_controls:
+    rows.append(f"\nTime Control Distribution:")
+    for tc, count in time_controls.most_common():
         percentage = (count / total_games) * 100
-        print(f"  {tc}: {count} games ({percentage:.1f}%)")
+        rows.append(f"  {tc}: {count} games ({percentage:.1f}%)")
+
+    # Single buffered write instead of one syscall per report line
+    sys.stdout.write('\n'.join(rows) + '\n')
 
 
 def main():
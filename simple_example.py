@@ -4,18 +4,37 @@ Simple Chess.com API Example
 A quick start guide to using the Chess.com Public API with Python.
 """
 
+import time
+
 from chessdotcom import get_player_profile, get_player_stats
 from chessdotcom.client import Client
 
 # IMPORTANT: Set a proper User-Agent header (required by Chess.com API)
 Client.request_config['headers']['User-Agent'] = 'Chess.com Analytics Tool. Contact: your-email@example.com'
 
+# Remember recent API responses so asking about the same player twice
+# within 5 minutes doesn't repeat the network round trips
+PLAYER_CACHE_TTL_SECONDS = 300
+
+_player_cache = {}
+
+
+def _cached_fetch(fetch, username):
+    """Call a fetcher for a username, reusing a recent response if any."""
+    key = (fetch.__name__, username.lower())
+    cached = _player_cache.get(key)
+    if cached and time.time() - cached[0] < PLAYER_CACHE_TTL_SECONDS:
+        return cached[1]
+    response = fetch(username)
+    _player_cache[key] = (time.time(), response)
+    return response
+
 
 def get_player_info(username):
     """Get basic information about a Chess.com player."""
     try:
         # Get player profile
-        profile = get_player_profile(username)
+        profile = _cached_fetch(get_player_profile, username)
         player_data = profile.json['player']
         
         print(f"Player: {username}")
@@ -25,7 +44,7 @@ def get_player_info(username):
         print(f"Followers: {player_data.get('followers', 0)}")
         
         # Get player stats
-        stats = get_player_stats(username)
+        stats = _cached_fetch(get_player_stats, username)
         stats_data = stats.json
         
         # Show rapid chess rating if available